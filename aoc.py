@@ -0,0 +1,685 @@
+#!/usr/bin/env python3
+# ./aoc.py run 2024 6 --part 2 && python3 -m mypy aoc.py --strict
+
+#####################################
+### ⭐🎄 Advent of Code Tools 🎄⭐ ###
+#####################################
+
+### types
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+### utility
+
+import os
+import json
+import signal
+from contextlib import contextmanager
+
+#####################################
+### Input Store
+#####################################
+
+# inputs are cached on disk as inputs/{year}_{day:02}.txt and listed in
+# inputs/index.json as {"{year}/{day}": {"path", "sha256", "size"}} so a
+# lookup is one dict access instead of a directory scan
+
+INPUT_DIR:str = os.environ.get("AOC_INPUTS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "inputs"))
+INDEX_FILE:str = "index.json"
+INDEX_LOCK:str = ".index.lock"
+
+_index:Optional[Dict[str,Dict[str,object]]] = None
+
+def is_offline() -> bool:
+    return os.environ.get("AOC_OFFLINE", "") not in ("", "0")
+
+def _digest(text:str) -> str:
+    import hashlib
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def _atomic_write(path:str, text:str) -> None:
+    import tempfile
+    directory:str = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def _read_index() -> Dict[str,Dict[str,object]]:
+    try:
+        with open(os.path.join(INPUT_DIR, INDEX_FILE)) as f:
+            index:Dict[str,Dict[str,object]] = json.load(f)
+            return index
+    except FileNotFoundError:
+        return {}
+
+def load_index() -> Dict[str,Dict[str,object]]:
+    global _index
+    if _index is None:
+        _index = _read_index()
+    return _index
+
+@contextmanager
+def _index_lock() -> Iterator[None]:
+    # parallel workers fetch different days, so every index update holds
+    # an exclusive lock around its read, merge and write
+    os.makedirs(INPUT_DIR, exist_ok=True)
+    with open(os.path.join(INPUT_DIR, INDEX_LOCK), "w") as lock:
+        try:
+            import fcntl
+        except ImportError: # no flock on windows
+            yield
+            return
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+def cached_input(year:int, day:int) -> Optional[str]:
+    name:str = f"{year}_{day:02}.txt"
+    entry = load_index().get(f"{year}/{day}")
+    if entry is None:
+        # written by another process, or before its index entry landed
+        if os.path.isfile(os.path.join(INPUT_DIR, name)):
+            with open(os.path.join(INPUT_DIR, name)) as f:
+                return put_input(year, day, f.read())
+        return None
+    try:
+        with open(os.path.join(INPUT_DIR, str(entry["path"]))) as f:
+            text:str = f.read()
+    except FileNotFoundError:
+        return None
+    if _digest(text) != entry["sha256"]:
+        return None
+    return text
+
+def put_input(year:int, day:int, text:str) -> str:
+    global _index
+    name:str = f"{year}_{day:02}.txt"
+    _atomic_write(os.path.join(INPUT_DIR, name), text)
+    with _index_lock():
+        # merge into the index on disk, not the copy loaded at startup
+        index = _read_index()
+        index[f"{year}/{day}"] = {"path": name, "sha256": _digest(text), "size": len(text)}
+        _atomic_write(os.path.join(INPUT_DIR, INDEX_FILE), json.dumps(index, indent=1, sort_keys=True))
+    _index = index
+    return text
+
+def get_input(session:str, year:int, day:int, offline:Optional[bool]=None) -> str:
+    if (text := cached_input(year, day)) is not None:
+        return text
+    # adopt the old ./{year}_{day}.txt cache from aoc2024
+    if os.path.isfile(legacy := f"{year}_{day}.txt"):
+        with open(legacy) as f:
+            return put_input(year, day, f.read())
+    if offline is None:
+        offline = is_offline() or not session
+    if offline:
+        raise LookupError(f"no cached input for {year} day {day} (offline)")
+    import requests
+    cookies:Dict[str,str] = {"session": session}
+    response = requests.get(f"https://adventofcode.com/{year}/day/{day}/input", cookies=cookies)
+    response.raise_for_status()
+    return put_input(year, day, response.text)
+
+#####################################
+### Import Budget
+#####################################
+
+# importing a year module must only define solvers: no network, no prints,
+# no numpy/shapely/z3 until a solver that needs them is called
+
+import sys
+
+YEARS:List[int] = [2022, 2023, 2024, 2025]
+IMPORT_BUDGET:float = 0.050 # seconds
+HEAVY_MODULES:List[str] = ["numpy", "shapely", "z3", "requests"]
+
+def import_time(module:str) -> float:
+    import subprocess
+    root:str = os.path.dirname(os.path.abspath(__file__))
+    env:Dict[str,str] = {**os.environ, "PYTHONPATH": root}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command:List[str] = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    # first run writes the .pyc so the second one measures the import only
+    subprocess.run(command, env=env, cwd=root, capture_output=True, check=True)
+    result = subprocess.run(command, env=env, cwd=root, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+    raise ValueError(f"{module} missing from -X importtime output")
+
+def heavy_imports(module:str) -> List[str]:
+    import subprocess
+    root:str = os.path.dirname(os.path.abspath(__file__))
+    code:str = f"import sys, {module}; print(*(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+#####################################
+### Solver Registry
+#####################################
+
+# each year names its solvers differently:
+#   2022       class Day1CalorieCounting(data) with .part1() and .part2()
+#   2023       def Day1Part1(data) and def Day1Part2(data)
+#   2024/2025  def Day1(data) -> (silver, gold)
+# discovery wraps all of them behind Solver.run(data, parts)
+
+import re
+from types import FunctionType
+from importlib import import_module
+
+PARTS:List[int] = [1, 2]
+
+class Solver(object):
+    def __init__(self, year:int, day:int, name:str,
+                 run:Callable[[str, Sequence[int]], Dict[int,Any]], separable:bool):
+        self.year:int = year
+        self.day:int = day
+        self.name:str = name
+        # separable solvers can run each part on its own, the others
+        # always compute both parts in one call
+        self.separable:bool = separable
+        self._run = run
+
+    def run(self, data:str, parts:Sequence[int]=PARTS) -> Dict[int,Any]:
+        return self._run(data, parts)
+
+    def example(self, part:int) -> Optional[str]:
+        module = import_module(f"aoc{self.year}")
+        for name in (f"input{self.day}_part{part}", f"input{self.day}"):
+            if isinstance(example := getattr(module, name, None), str):
+                return example
+        return None
+
+    def __repr__(self) -> str:
+        return f"Solver({self.year}, {self.day}, {self.name!r})"
+
+def _class_solver(cls:type) -> Callable[[str, Sequence[int]], Dict[int,Any]]:
+    def run(data:str, parts:Sequence[int]) -> Dict[int,Any]:
+        solution = cls(data)
+        if hasattr(solution, "process"):
+            answers = dict(zip(PARTS, solution.process()))
+            return {part: answers[part] for part in parts}
+        return {part: getattr(solution, f"part{part}")() for part in parts}
+    return run
+
+def _part_solver(functions:Dict[int,Callable[[str],Any]]) -> Callable[[str, Sequence[int]], Dict[int,Any]]:
+    def run(data:str, parts:Sequence[int]) -> Dict[int,Any]:
+        return {part: functions[part](data) for part in parts if part in functions}
+    return run
+
+def _tuple_solver(function:Callable[[str],Any]) -> Callable[[str, Sequence[int]], Dict[int,Any]]:
+    def run(data:str, parts:Sequence[int]) -> Dict[int,Any]:
+        result = function(data)
+        answers = dict(zip(PARTS, result if isinstance(result, tuple) else (result,)))
+        return {part: answers[part] for part in parts if part in answers}
+    return run
+
+REGISTRY:Dict[int,Dict[int,Solver]] = {}
+
+def solvers(year:int) -> Dict[int,Solver]:
+    if year in REGISTRY:
+        return REGISTRY[year]
+    module = import_module(f"aoc{year}")
+    found:Dict[int,Solver] = {}
+    split:Dict[int,Dict[int,Callable[[str],Any]]] = {}
+    for name, value in vars(module).items():
+        if getattr(value, "__module__", None) != module.__name__:
+            continue
+        if isinstance(value, type) and (match := re.fullmatch(r"Day(\d+)[A-Z]\w*", name)):
+            day = int(match[1])
+            found[day] = Solver(year, day, name, _class_solver(value), not hasattr(value, "process"))
+        elif isinstance(value, FunctionType) and (match := re.fullmatch(r"Day(\d+)Part(\d)", name)):
+            split.setdefault(int(match[1]), {})[int(match[2])] = value
+        elif isinstance(value, FunctionType) and (match := re.fullmatch(r"Day(\d+)", name)):
+            day = int(match[1])
+            found[day] = Solver(year, day, name, _tuple_solver(value), False)
+    for day, functions in split.items():
+        found[day] = Solver(year, day, f"Day{day}Part*", _part_solver(functions), True)
+    REGISTRY[year] = dict(sorted(found.items()))
+    return REGISTRY[year]
+
+def get_solver(year:int, day:int) -> Solver:
+    try:
+        return solvers(year)[day]
+    except KeyError:
+        raise LookupError(f"no solver for {year} day {day}") from None
+
+def load_input(year:int, day:int, part:int=1, example:bool=False, path:Optional[str]=None,
+               scale:Optional[float]=None, seed:int=0) -> str:
+    if path is not None:
+        with open(path) as f:
+            return f.read()
+    if scale is not None:
+        from aocgen import generate
+        return generate(year, day, scale, seed)
+    if example:
+        if (text := get_solver(year, day).example(part)) is None:
+            raise LookupError(f"no example for {year} day {day}")
+        return text
+    session:str = str(os.environ.get("AOC_SESSION") or getattr(import_module(f"aoc{year}"), "SESSION", "") or "")
+    return get_input(session, year, day)
+
+def run_solver(year:int, day:int, parts:Sequence[int]=PARTS, example:bool=False,
+               path:Optional[str]=None, scale:Optional[float]=None, seed:int=0) -> Dict[int,Any]:
+    solver:Solver = get_solver(year, day)
+    # examples can differ per part (2023 day 1), so group parts by input
+    inputs:Dict[str,List[int]] = {}
+    for part in parts:
+        inputs.setdefault(load_input(year, day, part, example, path, scale, seed), []).append(part)
+    answers:Dict[int,Any] = {}
+    for data, group in inputs.items():
+        answers.update(solver.run(data, group))
+    return answers
+
+#####################################
+### Benchmarks
+#####################################
+
+# every (year, day, part) is timed on its example and, when cached, on the
+# full input: one cold call, N warm calls and one call under tracemalloc
+
+import io
+import math
+import argparse
+import time
+from contextlib import redirect_stdout
+
+BENCH_FILE:str = "bench.json"
+BENCH_REPEAT:int = 5
+BENCH_THRESHOLD:float = 0.25 # allowed slowdown of the median
+BENCH_NOISE:float = 0.001 # seconds, ignore slowdowns smaller than this
+
+def percentile(samples:Sequence[float], q:float) -> float:
+    ordered:List[float] = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+def bench_inputs(solver:Solver, part:int, scales:Sequence[float]=()) -> Dict[str,str]:
+    inputs:Dict[str,str] = {}
+    if (example := solver.example(part)) is not None:
+        inputs["example"] = example
+    if (full := cached_input(solver.year, solver.day)) is not None:
+        inputs["full"] = full
+    if scales:
+        from aocgen import GENERATORS, generate
+        if (solver.year, solver.day) in GENERATORS:
+            for scale in scales:
+                inputs[f"x{scale:g}"] = generate(solver.year, solver.day, scale)
+    return inputs
+
+def bench_solver(solver:Solver, data:str, part:int, repeat:int=BENCH_REPEAT) -> Dict[str,float]:
+    import tracemalloc
+    samples:List[float] = []
+    # solvers print progress (2022 day 15), keep it out of the report
+    with redirect_stdout(io.StringIO()):
+        start:float = time.perf_counter()
+        solver.run(data, [part])
+        cold:float = time.perf_counter() - start
+        for _ in range(repeat):
+            start = time.perf_counter()
+            solver.run(data, [part])
+            samples.append(time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            solver.run(data, [part])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {"cold": cold,
+            "min": min(samples),
+            "median": percentile(samples, 0.5),
+            "p95": percentile(samples, 0.95),
+            "peak": peak}
+
+def regressions(results:Dict[str,Dict[str,float]], baseline:Dict[str,Dict[str,float]],
+                threshold:float=BENCH_THRESHOLD) -> List[str]:
+    slower:List[str] = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        before, after = baseline[key]["median"], result["median"]
+        if after > before * (1 + threshold) and after - before > BENCH_NOISE:
+            slower.append(f"{key}: median {before*1e3:.2f}ms -> {after*1e3:.2f}ms")
+    return slower
+
+def cmd_bench(args:argparse.Namespace) -> int:
+    results:Dict[str,Dict[str,float]] = {}
+    failed:List[str] = []
+    for year in ([args.year] if args.year else YEARS):
+        for day, solver in solvers(year).items():
+            if args.days and day not in args.days:
+                continue
+            for part in args.part or PARTS:
+                for kind, data in bench_inputs(solver, part, args.scale or ()).items():
+                    if args.kind and kind != args.kind and not (args.kind == "synthetic" and kind[0] == "x"):
+                        continue
+                    key:str = f"{year}/{day}/{part}/{kind}"
+                    try:
+                        result = results[key] = bench_solver(solver, data, part, args.repeat)
+                    except Exception as error:
+                        print(f"{key:<20} ❌ {type(error).__name__}: {error}")
+                        failed.append(key)
+                        continue
+                    print(f"{key:<20} cold {result['cold']*1e3:9.2f}ms"
+                          f"  min {result['min']*1e3:9.2f}ms"
+                          f"  median {result['median']*1e3:9.2f}ms"
+                          f"  p95 {result['p95']*1e3:9.2f}ms"
+                          f"  peak {result['peak']/1024:9.1f}KiB")
+    if args.write:
+        _atomic_write(os.path.abspath(args.baseline), json.dumps(results, indent=1, sort_keys=True))
+        return 1 if failed else 0
+    if not os.path.isfile(args.baseline):
+        return 1 if failed else 0
+    with open(args.baseline) as f:
+        slower:List[str] = regressions(results, json.load(f), args.threshold)
+    for line in slower:
+        print(f"❌ {line}")
+    return 1 if slower or failed else 0
+
+#####################################
+### Profiling
+#####################################
+
+# ./aoc.py run YEAR DAY --profile runs each selected day twice, once under
+# cProfile and once under tracemalloc, so neither skews the other, and writes
+#   profiles/{year}_{day:02}.prof    pstats dump (snakeviz, python -m pstats)
+#   profiles/{year}_{day:02}.folded  collapsed stacks in microseconds (flamegraph.pl)
+#   profiles/{year}_{day:02}.txt     top functions and top allocating lines
+
+PROFILE_DIR:str = "profiles"
+PROFILE_TOP:int = 20
+PROFILE_DEPTH:int = 64
+PROFILE_INTERVAL:float = 0.010 # seconds between allocation snapshots
+
+Frame = Tuple[str, int, str]
+
+def _frame_name(frame:Frame) -> str:
+    filename, line, name = frame
+    if filename == "~":
+        return name # builtins are shown as "<built-in method ...>"
+    return f"{os.path.basename(filename)}:{name}:{line}"
+
+def collapsed_stacks(stats:Any) -> Dict[str,int]:
+    # cProfile only keeps caller -> callee edges, so stacks are rebuilt by
+    # walking the graph from its roots and splitting each function's self
+    # time between its callers in proportion to the time they spent in it
+    callees:Dict[Frame,Dict[Frame,float]] = {}
+    for frame, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees.setdefault(caller, {})[frame] = cumulative
+    stacks:Dict[str,int] = {}
+
+    def walk(frame:Frame, share:float, path:List[str]) -> None:
+        _, _, self_time, cumulative, _ = stats.stats[frame]
+        fraction:float = min(1.0, share / cumulative) if cumulative else 0.0
+        path = path + [_frame_name(frame)]
+        if (micros := round(self_time * fraction * 1e6)) > 0:
+            key:str = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + micros
+        if len(path) >= PROFILE_DEPTH:
+            return
+        for callee, edge in callees.get(frame, {}).items():
+            # recursion is folded into the first occurrence on the path
+            if _frame_name(callee) not in path:
+                walk(callee, edge * fraction, path)
+
+    for frame, (_, _, _, cumulative, callers) in stats.stats.items():
+        if not callers:
+            walk(frame, cumulative, [])
+    return stacks
+
+def profile_solver(year:int, day:int, parts:Sequence[int]=PARTS, example:bool=False,
+                   path:Optional[str]=None, scale:Optional[float]=None, seed:int=0,
+                   directory:str=PROFILE_DIR, top:int=PROFILE_TOP) -> Dict[int,Any]:
+    import cProfile
+    import pstats
+    import tracemalloc
+    # inputs are loaded up front so fetching and generating stay out of the profile
+    inputs:Dict[str,List[int]] = {}
+    for part in parts:
+        inputs.setdefault(load_input(year, day, part, example, path, scale, seed), []).append(part)
+    solver:Solver = get_solver(year, day)
+    answers:Dict[int,Any] = {}
+    profiler = cProfile.Profile()
+    # tracemalloc only sees live blocks, so the allocation report comes
+    # from the largest of the snapshots sampled while the solver runs
+    snapshots:List[Tuple[int,Any]] = []
+
+    def sample(signum:int, frame:Any) -> None:
+        if not snapshots or tracemalloc.get_traced_memory()[0] > snapshots[0][0]:
+            snapshots[:] = [(tracemalloc.get_traced_memory()[0], tracemalloc.take_snapshot())]
+
+    with redirect_stdout(io.StringIO()):
+        for data, group in inputs.items():
+            profiler.enable()
+            try:
+                result = solver.run(data, group)
+            finally:
+                profiler.disable()
+            answers.update(result)
+        handler = signal.signal(signal.SIGALRM, sample)
+        tracemalloc.start()
+        try:
+            signal.setitimer(signal.ITIMER_REAL, PROFILE_INTERVAL, PROFILE_INTERVAL)
+            for data, group in inputs.items():
+                solver.run(data, group)
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            sample(signal.SIGALRM, None)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            tracemalloc.stop()
+            signal.signal(signal.SIGALRM, handler)
+    snapshot = snapshots[0][1]
+
+    os.makedirs(directory, exist_ok=True)
+    prefix:str = os.path.join(directory, f"{year}_{day:02}")
+    profiler.dump_stats(f"{prefix}.prof")
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stacks:Dict[str,int] = collapsed_stacks(stats)
+    _atomic_write(os.path.abspath(f"{prefix}.folded"), "".join(f"{stack} {micros}\n" for stack, micros in sorted(stacks.items())))
+
+    print(f"[ {year} Day {day} part {','.join(map(str, parts))} ]", file=report)
+    print(f"peak {peak/1024:.1f}KiB, {snapshots[0][0]/1024:.1f}KiB live at the sampled snapshot\n", file=report)
+    print(f"[ Top {top} Functions ]", file=report)
+    stats.sort_stats("cumulative").print_stats(top)
+    print(f"[ Top {top} Allocations ]", file=report)
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    for statistic in snapshot.statistics("lineno")[:top]:
+        frame = statistic.traceback[0]
+        print(f"{statistic.size/1024:9.1f}KiB {statistic.count:8} blocks  "
+              f"{os.path.basename(frame.filename)}:{frame.lineno}", file=report)
+    _atomic_write(os.path.abspath(f"{prefix}.txt"), report.getvalue())
+    return answers
+
+#####################################
+### Parallel Executor
+#####################################
+
+# days are independent, so (year, day, parts) jobs go to a process pool and
+# results stream back as they finish; a job that raises or runs past its
+# timeout only fails itself
+
+Job = Tuple[int, int, Tuple[int, ...]]
+
+def plan_jobs(years:Sequence[int], days:Sequence[int]=(), parts:Sequence[int]=PARTS) -> List[Job]:
+    jobs:List[Job] = []
+    for year in years:
+        for day, solver in solvers(year).items():
+            if days and day not in days:
+                continue
+            if solver.separable:
+                jobs += [(year, day, (part,)) for part in parts]
+            else:
+                jobs.append((year, day, tuple(parts)))
+    return jobs
+
+def _timeout(signum:int, frame:Any) -> None:
+    raise TimeoutError("timed out")
+
+def run_job(job:Job, example:bool=False, timeout:Optional[float]=None,
+            scale:Optional[float]=None, seed:int=0) -> Dict[int,Any]:
+    year, day, parts = job
+    if timeout:
+        signal.signal(signal.SIGALRM, _timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with redirect_stdout(io.StringIO()):
+            return run_solver(year, day, parts, example, None, scale, seed)
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+def run_jobs(jobs:Sequence[Job], workers:Optional[int]=None, example:bool=False,
+             timeout:Optional[float]=None, scale:Optional[float]=None,
+             seed:int=0) -> Iterator[Tuple[Job, Dict[int,Any], Optional[str]]]:
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+    pending:List[Job] = list(jobs)
+    while pending:
+        broken:List[Job] = []
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {pool.submit(run_job, job, example, timeout, scale, seed): job for job in pending}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    yield job, future.result(), None
+                except BrokenProcessPool:
+                    broken.append(job)
+                except Exception as error:
+                    yield job, {}, f"{type(error).__name__}: {error}"
+        broken.sort(key=pending.index)
+        if broken and workers == 1:
+            # a single worker runs jobs in order, so the first broken one died
+            yield broken[0], {}, "worker crashed"
+            broken = broken[1:]
+        # retry the jobs caught in a crash one at a time to find the culprit
+        pending, workers = broken, 1
+
+#####################################
+### Runner
+#####################################
+
+def cmd_run(args:argparse.Namespace) -> int:
+    if args.jobs is not None:
+        return cmd_run_parallel(args)
+    status:int = 0
+    if len(args.year) != 1:
+        print("running several years needs --jobs", file=sys.stderr)
+        return 2
+    year:int = args.year[0]
+    days:List[int] = args.days or list(solvers(year))
+    for day in days:
+        try:
+            if args.profile:
+                answers = profile_solver(year, day, args.part or PARTS, args.example, args.input,
+                                         args.scale, args.seed, args.profile, args.top)
+                print(f"{year} Day {day}: profile in {os.path.join(args.profile, f'{year}_{day:02}')}.*", file=sys.stderr)
+            else:
+                answers = run_solver(year, day, args.part or PARTS, args.example, args.input, args.scale, args.seed)
+        except LookupError as error:
+            print(f"{year} Day {day}: {error}", file=sys.stderr)
+            status = 1
+            continue
+        for part, answer in answers.items():
+            print(f"{year} Day {day} part {part}: {answer}")
+    return status
+
+def cmd_run_parallel(args:argparse.Namespace) -> int:
+    status:int = 0
+    if args.input or args.profile:
+        print(f"--{'input' if args.input else 'profile'} cannot be combined with --jobs", file=sys.stderr)
+        return 2
+    jobs:List[Job] = plan_jobs(args.year, args.days, args.part or PARTS)
+    for (year, day, parts), answers, error in run_jobs(jobs, args.jobs, args.example, args.timeout,
+                                                       args.scale, args.seed):
+        if error:
+            print(f"{year} Day {day} part {','.join(map(str, parts))}: ❌ {error}", file=sys.stderr)
+            status = 1
+            continue
+        for part, answer in answers.items():
+            print(f"{year} Day {day} part {part}: {answer}", flush=True)
+    return status
+
+def year_list(value:str) -> List[int]:
+    return YEARS if value == "all" else [int(year) for year in value.split(",")]
+
+def cmd_gen(args:argparse.Namespace) -> int:
+    from aocgen import generate
+    sys.stdout.write(generate(args.year, args.day, args.scale, args.seed))
+    return 0
+
+def cmd_list(args:argparse.Namespace) -> int:
+    for year in args.years or YEARS:
+        for day, solver in solvers(year).items():
+            print(f"{year} Day {day}: {solver.name}")
+    return 0
+
+def cmd_check(args:argparse.Namespace) -> int:
+    print("[ Import Budget ]:")
+    for year in YEARS:
+        assert not heavy_imports(f"aoc{year}"), f"❌ aoc{year}"
+        assert import_time(f"aoc{year}") < IMPORT_BUDGET, f"❌ aoc{year}"; print(f"✅ aoc{year}")
+    return 0
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc", description="⭐🎄 Advent of Code runner 🎄⭐")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the selected days of a year")
+    run.add_argument("year", type=year_list, help="year, comma separated years or all")
+    run.add_argument("days", type=int, nargs="*", help="days to run (default: all)")
+    run.add_argument("--part", type=int, choices=PARTS, action="append", help="part to run (repeatable)")
+    run.add_argument("--example", action="store_true", help="use the example embedded in the solver")
+    run.add_argument("--input", metavar="FILE", help="read the puzzle input from FILE")
+    run.add_argument("--scale", type=float, help="run on a generated input of this scale")
+    run.add_argument("--seed", type=int, default=0, help="seed for the generated input")
+    run.add_argument("-j", "--jobs", type=int, nargs="?", const=0, help="run days in a process pool (default size: cores)")
+    run.add_argument("--timeout", type=float, help="seconds before a parallel job is abandoned")
+    run.add_argument("--profile", metavar="DIR", nargs="?", const=PROFILE_DIR, help=f"write cProfile, flamegraph and allocation reports to DIR (default: {PROFILE_DIR})")
+    run.add_argument("--top", type=int, default=PROFILE_TOP, help="rows in the profile report")
+    run.set_defaults(command=cmd_run)
+
+    gen = commands.add_parser("gen", help="print a generated input")
+    gen.add_argument("year", type=int)
+    gen.add_argument("day", type=int)
+    gen.add_argument("--scale", type=float, default=1, help="input size relative to a real input")
+    gen.add_argument("--seed", type=int, default=0)
+    gen.set_defaults(command=cmd_gen)
+
+    listing = commands.add_parser("list", help="list the registered solvers")
+    listing.add_argument("years", type=int, nargs="*")
+    listing.set_defaults(command=cmd_list)
+
+    bench = commands.add_parser("bench", help="time solvers and compare against a baseline")
+    bench.add_argument("year", type=int, nargs="?", help="year to bench (default: all)")
+    bench.add_argument("days", type=int, nargs="*", help="days to bench (default: all)")
+    bench.add_argument("--part", type=int, choices=PARTS, action="append", help="part to bench (repeatable)")
+    bench.add_argument("--kind", choices=["example", "full", "synthetic"], help="only bench this kind of input")
+    bench.add_argument("--scale", type=float, action="append", help="also bench a generated input of this scale (repeatable)")
+    bench.add_argument("--repeat", type=int, default=BENCH_REPEAT, help="warm runs per solver")
+    bench.add_argument("--baseline", default=BENCH_FILE, help="baseline json to compare against or write")
+    bench.add_argument("--threshold", type=float, default=BENCH_THRESHOLD, help="allowed median slowdown")
+    bench.add_argument("--write", action="store_true", help="write the results as the new baseline")
+    bench.set_defaults(command=cmd_bench)
+
+    check = commands.add_parser("check", help="check the import time budget")
+    check.set_defaults(command=cmd_check)
+    return parser
+
+def main(argv:Optional[List[str]]=None) -> int:
+    args = parser().parse_args(argv)
+    return int(args.command(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
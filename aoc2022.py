@@ -7,151 +7,180 @@
 
 ### types
 
-from typing import List, Dict, Optional, Set, Any, Tuple, Iterator, cast
+from typing import List, Dict, Optional, Set, Any, Tuple, Iterable, Iterator, TYPE_CHECKING
 
 ### utility
 
-import requests
 from os import system
 from time import sleep
 from datetime import datetime
 
-def get_input(session:str, year:int, day:int) -> str:
-    cookies:Dict[str,str] = {"session": session}
-    request = requests.get(f"https://adventofcode.com/{year}/day/{day}/input", cookies=cookies)
-    return request.text
-
-SESSION = ""
-data15 = get_input(SESSION, 2022, 15)
+SESSION = "" # read by ./aoc.py run when AOC_SESSION is unset
 
 #####################################
 ### Day 1: Calorie Counting
 #####################################
 
-from heapq import nlargest, heappush
+from heapq import heappush, heappushpop
 
 class Day1CalorieCounting(object):
-    def __init__(self, data:str):
-        self.data:List[Optional[int]] = [x and int(x) or None
-                                         for x in data.splitlines()]
+    def __init__(self, data:str, top:int=3):
+        self.totals:List[int] = self.largest_totals([data.encode()], top)
 
-    def part1(self) -> int:
-        largest:int = -1
-        running_total:int = 0
-        for calorie in self.data:
-            if calorie:
-                running_total += calorie
-                largest = max(running_total, largest)
-            else:
-                running_total = 0
-        return largest
+    @classmethod
+    def from_chunks(cls, chunks:Iterable[bytes], top:int=3) -> "Day1CalorieCounting":
+        # e.g. iter(partial(file.read, 1 << 20), b"") for a log of any size
+        solution = cls.__new__(cls)
+        solution.totals = cls.largest_totals(chunks, top)
+        return solution
 
-    def part2(self) -> int:
+    @staticmethod
+    def largest_totals(chunks:Iterable[bytes], top:int) -> List[int]:
+        # one pass over the chunks keeping a min-heap of the top totals,
+        # only the unfinished last line of a chunk is carried over
         heap:List[int] = []
         running_total:int = 0
-        for calorie in self.data:
-            if calorie:
-                running_total += calorie
-            else:
-                heappush(heap, running_total)
+        carry:bytes = b""
+
+        def finish(total:int) -> None:
+            if len(heap) < top:
+                heappush(heap, total)
+            elif total > heap[0]:
+                heappushpop(heap, total)
+
+        for chunk in chunks:
+            *elves, tail = (carry + chunk).split(b"\n\n")
+            for elf in elves:
+                finish(running_total + sum(map(int, elf.split())))
                 running_total = 0
-        return sum(nlargest(3, heap))
+            # keep the newline before the last line so a blank line
+            # split across two chunks is still seen
+            cut:int = tail.rfind(b"\n")
+            running_total += sum(map(int, tail[:max(cut, 0)].split()))
+            carry = tail[max(cut, 0):]
+        if carry.strip() or running_total:
+            finish(running_total + sum(map(int, carry.split())))
+        return sorted(heap, reverse=True)
+
+    def part1(self) -> int:
+        return self.totals[0]
+
+    def part2(self) -> int:
+        return sum(self.totals)
+
+input1:str = "1000\n" +\
+             "2000\n" +\
+             "3000\n\n" +\
+             "4000\n\n" +\
+             "5000\n" +\
+             "6000\n\n" +\
+             "7000\n" +\
+             "8000\n" +\
+             "9000\n\n" +\
+             "10000\n\n"
 
 if __name__ == "__main__":
     print("\n⭐🎄 AOC 2022 🎄⭐\n")
     print("[ Day 1 ]:")
-    input1:str = "1000\n" +\
-                 "2000\n" +\
-                 "3000\n\n" +\
-                 "4000\n\n" +\
-                 "5000\n" +\
-                 "6000\n\n" +\
-                 "7000\n" +\
-                 "8000\n" +\
-                 "9000\n\n" +\
-                 "10000\n\n"
     solution1 = Day1CalorieCounting(input1)
     assert solution1.part1() == 24000, "❌ Part 1"; print("✅ Part 1")
-    assert solution1.part2() == 45000, "❌ Part 2"; print("✅ Part 2\n")
+    assert solution1.part2() == 45000, "❌ Part 2"; print("✅ Part 2")
+    chunks = (input1.strip().encode()[i:i+4] for i in range(0, len(input1), 4))
+    assert Day1CalorieCounting.from_chunks(chunks, top=4).totals == [24000, 11000, 10000, 6000], \
+        "❌ Streaming"; print("✅ Streaming\n")
 
 #####################################
 ### Day 2: Rock Paper Scissors
 #####################################
 
 class Day2RockPaperScissors(object):
+    # round -> (part 1 score, part 2 score)
+    #   part 1: shape (rock 1, paper 2, scissors 3) + outcome (0, 3, 6)
+    #   part 2: X/Y/Z is lose/draw/win, so the outcome is fixed and the
+    #           shape is whatever gives it
+    ROUNDS:Dict[str,Tuple[int,int]] = {
+        "A X": (1+3, 3+0), "B X": (1+0, 1+0), "C X": (1+6, 2+0),
+        "A Y": (2+6, 1+3), "B Y": (2+3, 2+3), "C Y": (2+0, 3+3),
+        "A Z": (3+0, 2+6), "B Z": (3+6, 3+6), "C Z": (3+3, 1+6),
+    }
+
     def __init__(self, data:str):
-        self.data = data.strip().splitlines()
+        # the nine rounds are the only three byte lines, so one str.count
+        # each scores the whole guide without a loop over the lines
+        text:str = data.strip()
+        self.counts:Dict[str,int] = {outcome: text.count(outcome) for outcome in self.ROUNDS}
+        lines:int = text.count("\n") + 1
+        # the counts only score the guide when every line is exactly one
+        # three byte round, otherwise scan it line by line
+        if text and (sum(self.counts.values()) != lines or len(text) != 4 * lines - 1 or "\n\n" in text):
+            self.counts = {outcome: 0 for outcome in self.ROUNDS}
+            for line in text.splitlines():
+                if line not in self.ROUNDS:
+                    raise ValueError(f"invalid outcome: {line}")
+                self.counts[line] += 1
+
+    def score(self, part:int) -> int:
+        return sum(count * self.ROUNDS[outcome][part-1]
+                   for outcome, count in self.counts.items())
 
     def part1(self) -> int:
-        def score(outcome:str) -> int:
-            match outcome:
-                # rock
-                case "A X": return 1+3
-                case "B X": return 1+0
-                case "C X": return 1+6
-                # paper
-                case "A Y": return 2+6
-                case "B Y": return 2+3
-                case "C Y": return 2+0
-                # scissors
-                case "A Z": return 3+0
-                case "B Z": return 3+6
-                case "C Z": return 3+3
-                case _:
-                    raise ValueError(f"invalid outcome: {outcome}")
-        return sum([score(x) for x in self.data])
+        return self.score(1)
 
     def part2(self) -> int:
-        def score(outcome:str) -> int:
-            match outcome:
-                # lose
-                case "C X": return 0+2
-                case "A X": return 0+3
-                case "B X": return 0+1
-                # draw
-                case "A Y": return 1+3
-                case "B Y": return 2+3
-                case "C Y": return 3+3
-                # win
-                case "C Z": return 1+6
-                case "A Z": return 2+6
-                case "B Z": return 3+6
-                case _:
-                    raise ValueError(f"invalid outcome: {outcome}")
-        return sum([score(x) for x in self.data])
+        return self.score(2)
+
+input2:str = "A Y\n" +\
+             "B X\n" +\
+             "C Z\n"
 
 if __name__ == "__main__":
     print("[ Day 2 ]:")
-    input2:str = "A Y\n" +\
-                 "B X\n" +\
-                 "C Z\n"
     solution2 = Day2RockPaperScissors(input2)
     assert solution2.part1() == 15, "❌ Part 1"; print("✅ Part 1")
-    assert solution2.part2() == 12, "❌ Part 2"; print("✅ Part 2\n")
+    assert solution2.part2() == 12, "❌ Part 2"; print("✅ Part 2")
+    for guide in ["A XX\n", "A X B Y\nzzz\n", "A XB Y\n\nC Z\n"]:
+        try: Day2RockPaperScissors(guide); assert False, "❌ Invalid"
+        except ValueError: pass
+    assert Day2RockPaperScissors("A Y\r\nB X\r\nC Z\r\n").part1() == 15, "❌ Invalid"; print("✅ Invalid\n")
 
 #####################################
 ### Day 3: Rucksack Reorganization
 #####################################
 
+from string import ascii_letters
+
 class Day3RucksackReorganization(object):
     def __init__(self, data:str):
-        self.data:List[str] = data.strip().splitlines()
+        import numpy as np
+        # every item is one bit of a 52 bit mask (bit n is priority n), so a
+        # rucksack is the OR of its items and common items are an AND
+        raw:Any = np.frombuffer(data.strip().encode(), np.uint8)
+        bits:Any = np.zeros(256, np.uint64)
+        for letter in ascii_letters:
+            bits[ord(letter)] = 1 << self.priority_value(letter)
+        items:Any = bits[raw] # newlines are 0
+        starts:Any = np.concatenate(([0], np.flatnonzero(raw == ord("\n")) + 1))
+        ends:Any = np.append(starts[1:] - 1, len(raw))
+        middles:Any = (starts + ends) // 2
+        self.rucksacks:Any = np.bitwise_or.reduceat(items, starts)
+        self.compartments:Any = np.bitwise_or.reduceat(
+            items, np.stack((starts, middles), axis=1).ravel()).reshape(-1, 2)
 
     def part1(self) -> int:
-        def find_common(compartment:List[str]) -> int:
-            half:int = int(len(compartment)/2)
-            common:Set[str] = set(compartment[:half]) & set(compartment[half:])
-            return self.priority_value(common.pop())
-        return sum(map(find_common, self.data)) # type:ignore
+        return self.priorities(self.compartments[:, 0] & self.compartments[:, 1])
 
     def part2(self) -> int:
-        triplets:List[List[str]] = [self.data[i:i+3]
-                                    for i in range(0, len(self.data), 3)]
-        def find_common(group:List[str]) -> int:
-            first, second, third = cast(Tuple[str,str,str], group)
-            common:Set[str] = set(first) & set(second) & set(third)
-            return self.priority_value(common.pop())
-        return sum(map(find_common, triplets))
+        import numpy as np
+        return self.priorities(np.bitwise_and.reduce(self.rucksacks.reshape(-1, 3), axis=1))
+
+    @staticmethod
+    def priorities(masks:Any) -> int:
+        # one common item per mask, so its priority is the bit_length - 1
+        # of a power of two, which log2 gives exactly for nonzero masks
+        import numpy as np
+        if not masks.all():
+            raise ValueError("no common item")
+        return int(np.log2(masks).astype(np.int64).sum())
 
     @staticmethod
     def priority_value(letter:str) -> int:
@@ -160,17 +189,20 @@ class Day3RucksackReorganization(object):
         else:
             return ord(letter)-38
 
+input3:str = "vJrwpWtwJgWrhcsFMMfFFhFp\n" +\
+             "jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL\n" +\
+             "PmmdzqPrVvPwwTWBwg\n" +\
+             "wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn\n" +\
+             "ttgJtRGJQctTZtZT\n" +\
+             "CrZsJsPPZsGzwwsLwLmpwMDw\n"
+
 if __name__ == "__main__":
     print("[ Day 3 ]:")
-    input3:str = "vJrwpWtwJgWrhcsFMMfFFhFp\n" +\
-                 "jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL\n" +\
-                 "PmmdzqPrVvPwwTWBwg\n" +\
-                 "wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn\n" +\
-                 "ttgJtRGJQctTZtZT\n" +\
-                 "CrZsJsPPZsGzwwsLwLmpwMDw\n"
     solution3 = Day3RucksackReorganization(input3)
     assert solution3.part1() == 157, "❌ Part 1"; print("✅ Part 1")
-    assert solution3.part2() == 70,  "❌ Part 2"; print("✅ Part 2\n")
+    assert solution3.part2() == 70,  "❌ Part 2"; print("✅ Part 2")
+    try: Day3RucksackReorganization("abcd\n").part1(); assert False, "❌ No Common Item"
+    except ValueError: print("✅ No Common Item\n")
 
 
 #####################################
@@ -181,32 +213,29 @@ import re
 
 class Day4CampCleanup(object):
     def __init__(self, data:str):
-        self.data:List[str] = data.strip().splitlines()
+        import numpy as np
+        # one row of (s1, e1, s2, e2) per pair, every check below is a
+        # comparison of the endpoints so the size of a range never matters
+        numbers:List[str] = data.replace("-", " ").replace(",", " ").split()
+        self.pairs:Any = np.array(numbers, np.int64).reshape(-1, 4)
 
     def part1(self) -> int:
-        def overlaps(pair:str) -> int:
-            s1, e1, s2, e2 = cast(Tuple[int,int,int,int], map(int, re.findall(r"\d+", pair)))
-            set1:Set[int] = {*range(s1, e1+1)}
-            set2:Set[int] = {*range(s2, e2+1)}
-            return 1 if set1 & set2 in [set1, set2] else 0
-        return sum(map(overlaps, self.data))
+        s1, e1, s2, e2 = self.pairs.T
+        return int((((s1 <= s2) & (e2 <= e1)) | ((s2 <= s1) & (e1 <= e2))).sum())
 
     def part2(self) -> int:
-        def overlaps(pair:str) -> int:
-            s1, e1, s2, e2 = cast(Tuple[int,int,int,int], map(int, re.findall(r"\d+", pair)))
-            set1:Set[int] = {*range(s1, e1+1)}
-            set2:Set[int] = {*range(s2, e2+1)}
-            return 1 if set1 & set2 else 0
-        return sum(map(overlaps, self.data))
+        s1, e1, s2, e2 = self.pairs.T
+        return int(((s1 <= e2) & (s2 <= e1)).sum())
+
+input4:str = "2-4,6-8\n" +\
+             "2-3,4-5\n" +\
+             "5-7,7-9\n" +\
+             "2-8,3-7\n" +\
+             "6-6,4-6\n" +\
+             "2-6,4-8\n"
 
 if __name__ == "__main__":
     print("[ Day 4 ]:")
-    input4:str = "2-4,6-8\n" +\
-                 "2-3,4-5\n" +\
-                 "5-7,7-9\n" +\
-                 "2-8,3-7\n" +\
-                 "6-6,4-6\n" +\
-                 "2-6,4-8\n"
     solution = Day4CampCleanup(input4)
     assert solution.part1() == 2, "❌ Part 1"; print("✅ Part 1")
     assert solution.part2() == 4, "❌ Part 2"; print("✅ Part 2\n")
@@ -215,41 +244,38 @@ if __name__ == "__main__":
 ### Day 5: Supply Stacks
 #####################################
 
-from copy import deepcopy
-
 class Day5SupplyStacks(object):
     def __init__(self, input:str):
-        data:List[str] = input.splitlines()
-        rows:List[str] = []
-        self.moves:List[List[int]] = []
-        self.stacks:List[List[str]]
-
-        for line in data:
-            if "[" in line:
-                rows.insert(0,line)
-            elif line.startswith("move"):
-                numbers:List[str] = re.findall(r"\d+", line)
-                self.moves.append(list(map(int, numbers)))
+        drawing, _, procedure = input.partition("\nmove")
+        rows:List[str] = [line for line in drawing.splitlines() if "[" in line][::-1]
+        numbers:List[int] = list(map(int, re.findall(r"\d+", procedure)))
+        self.moves:List[Tuple[int,int,int]] = list(zip(numbers[::3], numbers[1::3], numbers[2::3]))
+        self.stacks:List[List[str]] = self.stackify([re.findall(r"\[([A-Z])\]|\s{3}\s", x) for x in rows])
+
+    def rearrange(self, *models:int) -> List[List[List[str]]]:
+        # one pass over the moves for every crane, each on its own shallow
+        # copy of the stacks; a move is two slices, reversed for the
+        # CrateMover 9000 which lifts one crate at a time
+        cranes:List[Tuple[bool, List[List[str]]]] = \
+            [(model == 9000, [stack[:] for stack in self.stacks]) for model in models]
+        for count, source, dest in self.moves:
+            if not count or source == dest:
+                continue # lifting crates back onto their own stack changes nothing
+            for reverse, stacks in cranes:
+                crates:List[str] = stacks[source-1][-count:]
+                del stacks[source-1][-count:]
+                stacks[dest-1] += crates[::-1] if reverse else crates
+        return [stacks for _, stacks in cranes]
 
-        self.stacks = self.stackify([re.findall(r"\[([A-Z])\]|\s{3}\s", x) for x in rows])
+    @staticmethod
+    def tops(stacks:List[List[str]]) -> str:
+        return "".join([x[-1] for x in stacks if x])
 
     def part1(self) -> str:
-        stacks:List[List[str]] = deepcopy(self.stacks)
-        def move(stacks:List[List[str]], count:int, source:int, dest:int) -> None:
-            for _ in range(count):
-                stacks[dest-1].append(stacks[source-1].pop())
-        for count, source, dest in self.moves:
-            move(stacks, count, source, dest)
-        return "".join([x[-1] for x in stacks])
+        return self.tops(self.rearrange(9000)[0])
 
     def part2(self) -> str:
-        stacks:List[List[str]] = deepcopy(self.stacks)
-        def move(stacks:List[List[str]], count:int, source:int, dest:int) -> None:
-            value:List[str] = [stacks[source-1].pop() for _ in range(count)]
-            stacks[dest-1] += reversed(value)
-        for count, source, dest in self.moves:
-            move(stacks, count, source, dest)
-        return "".join([x[-1] for x in stacks])
+        return self.tops(self.rearrange(9001)[0])
 
     @staticmethod
     def stackify(row:List[List[str]]) -> List[List[str]]:
@@ -261,36 +287,69 @@ class Day5SupplyStacks(object):
         return stacks
 
 
+input5:str= "    [D]    \n" +\
+            "[N] [C]    \n" +\
+            "[Z] [M] [P]\n" +\
+            " 1   2   3 \n" +\
+            "\n" +\
+            "move 1 from 2 to 1\n" +\
+            "move 3 from 1 to 3\n" +\
+            "move 2 from 2 to 1\n" +\
+            "move 1 from 1 to 2\n"
+
 if __name__ == "__main__":
     print("[ Day 5 ]:")
-    input5:str= "    [D]    \n" +\
-                "[N] [C]    \n" +\
-                "[Z] [M] [P]\n" +\
-                " 1   2   3 \n" +\
-                "\n" +\
-                "move 1 from 2 to 1\n" +\
-                "move 3 from 1 to 3\n" +\
-                "move 2 from 2 to 1\n" +\
-                "move 1 from 1 to 2\n"
-
     solution5 = Day5SupplyStacks(input5)
     assert solution5.part1() == "CMZ", "❌ Part 1"; print("✅ Part 1")
-    assert solution5.part2() == "MCD", "❌ Part 2"; print("✅ Part 2\n")
+    assert solution5.part2() == "MCD", "❌ Part 2"; print("✅ Part 2")
+    assert [*map(solution5.tops, solution5.rearrange(9000, 9001))] == ["CMZ", "MCD"], \
+        "❌ Both Cranes"; print("✅ Both Cranes")
+    assert Day5SupplyStacks(input5 + "move 2 from 3 to 3\n").part1() == "CMZ", "❌ Same Stack"; print("✅ Same Stack\n")
 
 #####################################
 ### Day 6: Tuning Trouble
 #####################################
 
+import mmap
+
 class Day6TuningTrouble(object):
     def __init__(self, data:str):
-        self.data:str = data
+        self.signal:memoryview = memoryview(data.strip().encode())
+
+    @classmethod
+    def from_file(cls, path:str) -> "Day6TuningTrouble":
+        # map the datastream instead of reading it, the scan stops at the
+        # last marker so only the pages up to it are touched
+        solution = cls.__new__(cls)
+        with open(path, "rb") as f:
+            signal:memoryview = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        # drop the trailing newline like __init__ does
+        end:int = len(signal)
+        while end and signal[end-1] in b"\r\n":
+            end -= 1
+        solution.signal = signal[:end]
+        return solution
+
+    def find_markers(self, sizes:List[int]) -> Dict[int,int]:
+        # grow a window of distinct bytes, a repeat moves its left edge past
+        # the previous copy, and each size is found the first time the
+        # window reaches it: one pass whatever the sizes are
+        last_seen:List[int] = [-1] * 256
+        left:int = 0
+        markers:Dict[int,int] = {size: -1 for size in sorted(set(sizes))}
+        pending:List[int] = [*reversed(markers)]
+        for right, byte in enumerate(self.signal):
+            if last_seen[byte] >= left:
+                left = last_seen[byte] + 1
+            last_seen[byte] = right
+            while pending and right - left + 1 >= pending[-1]:
+                markers[pending.pop()] = right + 1
+            if not pending:
+                break
+        return markers
 
     def find_window(self, minimum:int) -> int:
-        for left in range(len(self.data)-minimum):
-            window = set(self.data[left:left+minimum])
-            if len(window) == minimum:
-                return left + minimum
-        return -1
+        return self.find_markers([minimum])[minimum]
 
     def part1(self) -> int:
         return self.find_window(4)
@@ -298,105 +357,131 @@ class Day6TuningTrouble(object):
     def part2(self) -> int:
         return self.find_window(14)
 
+input6:str = "zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw"
+
 if __name__ == "__main__":
     print("[ Day 6 ]:")
-    input6:str = "zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw"
     solution6 = Day6TuningTrouble(input6)
     assert solution6.part1() == 11, "❌ Part 1"; print("✅ Part 1")
-    assert solution6.part2() == 26, "❌ Part 2"; print("✅ Part 2\n")
+    assert solution6.part2() == 26, "❌ Part 2"; print("✅ Part 2")
+    assert solution6.find_markers([14, 4, 27]) == {4: 11, 14: 26, 27: -1}, \
+        "❌ Markers"; print("✅ Markers")
+    import tempfile
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as f:
+        f.write("aacab\n"); f.flush()
+        assert Day6TuningTrouble.from_file(f.name).find_markers([4]) == \
+               Day6TuningTrouble("aacab\n").find_markers([4]) == {4: -1}, "❌ From File"; print("✅ From File\n")
 
 #####################################
 ### Day 7: No Space Left On Device
 #####################################
 
-from collections import deque
-
-class Folder:
-    def __init__(self, name:str):
-        self.name:str = name
-        self.size:int = 0
-        self.parent:Optional[Folder] = None
-        self.children:Dict[str,Folder] = {}
+import io
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
 
 class Day7NoSpaceLeftOnDevice(object):
+    # directories live in a flat table: directory i has parents[i] and
+    # sizes[i], and a child always gets a larger index than its parent
+    ROOT:int = 0
+
     def __init__(self, data:str):
-        self.root:Folder = Folder("root")
-        self.root.children["/"] = Folder("/")
-        current:Optional[Folder] = self.root
-        commands:deque[str] = deque(data.strip().splitlines())
-        while commands and current:
-            command:List[str] = commands.popleft().split(" ")
-            match command:
+        self.parse(io.StringIO(data))
+
+    @classmethod
+    def from_lines(cls, lines:Iterable[str]) -> "Day7NoSpaceLeftOnDevice":
+        # e.g. an open terminal log, read one line at a time
+        solution = cls.__new__(cls)
+        solution.parse(lines)
+        return solution
+
+    def parse(self, lines:Iterable[str]) -> None:
+        self.parents:array[int] = array("q", [self.ROOT])
+        self.sizes:array[int] = array("q", [0])
+        children:Dict[Tuple[int,str],int] = {}
+        current:int = self.ROOT
+
+        def child(name:str) -> int:
+            if (current, name) not in children:
+                children[(current, name)] = len(self.parents)
+                self.parents.append(current)
+                self.sizes.append(0)
+            return children[(current, name)]
+
+        for line in lines:
+            match line.split():
+                case ["$", "cd", "/"]:
+                    current = self.ROOT
+                case ["$", "cd", ".."]:
+                    current = self.parents[current]
                 case ["$", "cd", folder]:
-                    if folder == "..":
-                        current = current.parent
-                    else:
-                        current = current.children[folder]
+                    current = child(folder)
                 case ["$", "ls"]:
-                    while commands and not commands[0].startswith("$"):
-                        match commands.popleft().split(" "):
-                            case ["dir", folder]:
-                                node:Folder = Folder(folder)
-                                node.parent = current
-                                current.children[folder] = node
-                            case [size, _]:
-                                current.size += int(size)
-                                parent = current.parent
-                                while parent:
-                                    parent.size += int(size)
-                                    parent = parent.parent
-
-    def part1(self) -> int:
-        total:int = 0
-        queue:deque[Folder] = deque([self.root])
-        while len(queue) > 0:
-            node:Folder = queue.popleft()
-            if node.size < 100000:
-                total += node.size
-            for child in node.children.values():
-                queue.append(child)
-        return total
-
-    def part2(self) -> int:
-        required:int = 30000000 - (70000000 - self.root.children["/"].size)
-        smallest:int = 70000000
-        queue:deque[Folder] = deque([self.root])
-        while len(queue) > 0:
-            node:Folder = queue.popleft()
-            if node.size >= required and node.size < smallest:
-                smallest = node.size
-            for child in node.children.values():
-                queue.append(child)
-        return smallest
+                    pass
+                case ["dir", folder]:
+                    child(folder)
+                case [size, _]:
+                    self.sizes[current] += int(size)
+
+        # children come after their parents, so walking the table
+        # backwards is a post-order pass that adds every directory to its
+        # parent once
+        for node in range(len(self.parents) - 1, self.ROOT, -1):
+            self.sizes[self.parents[node]] += self.sizes[node]
+
+        # sorted sizes and their prefix sums answer any threshold query
+        # with one binary search
+        self.sorted_sizes:List[int] = sorted(self.sizes)
+        self.prefix_sums:List[int] = [0, *accumulate(self.sorted_sizes)]
+
+    def total_below(self, threshold:int) -> int:
+        return self.prefix_sums[bisect_left(self.sorted_sizes, threshold)]
+
+    def smallest_at_least(self, threshold:int) -> int:
+        i:int = bisect_left(self.sorted_sizes, threshold)
+        if i == len(self.sorted_sizes):
+            raise ValueError(f"no directory of at least {threshold}")
+        return self.sorted_sizes[i]
+
+    def part1(self, threshold:int=100000) -> int:
+        return self.total_below(threshold)
+
+    def part2(self, disk:int=70000000, update:int=30000000) -> int:
+        required:int = update - (disk - self.sizes[self.ROOT])
+        return self.smallest_at_least(required)
+
+input7:str = "$ cd /\n" +\
+             "$ ls\n" +\
+             "dir a\n" +\
+             "14848514 b.txt\n" +\
+             "8504156 c.dat\n" +\
+             "dir d\n" +\
+             "$ cd a\n" +\
+             "$ ls\n" +\
+             "dir e\n" +\
+             "29116 f\n" +\
+             "2557 g\n" +\
+             "62596 h.lst\n" +\
+             "$ cd e\n" +\
+             "$ ls\n" +\
+             "584 i\n" +\
+             "$ cd ..\n" +\
+             "$ cd ..\n" +\
+             "$ cd d\n" +\
+             "$ ls\n" +\
+             "4060174 j\n" +\
+             "8033020 d.log\n" +\
+             "5626152 d.ext\n" +\
+             "7214296 k\n"
 
 if __name__ == "__main__":
     print("[ Day 7 ]:")
-    input7:str = "$ cd /\n" +\
-                 "$ ls\n" +\
-                 "dir a\n" +\
-                 "14848514 b.txt\n" +\
-                 "8504156 c.dat\n" +\
-                 "dir d\n" +\
-                 "$ cd a\n" +\
-                 "$ ls\n" +\
-                 "dir e\n" +\
-                 "29116 f\n" +\
-                 "2557 g\n" +\
-                 "62596 h.lst\n" +\
-                 "$ cd e\n" +\
-                 "$ ls\n" +\
-                 "584 i\n" +\
-                 "$ cd ..\n" +\
-                 "$ cd ..\n" +\
-                 "$ cd d\n" +\
-                 "$ ls\n" +\
-                 "4060174 j\n" +\
-                 "8033020 d.log\n" +\
-                 "5626152 d.ext\n" +\
-                 "7214296 k\n"
     solution7 = Day7NoSpaceLeftOnDevice(input7)
     assert solution7.part1() == 95437,    "❌ Part 1"; print("✅ Part 1")
-    assert solution7.part2() == 24933642, "❌ Part 2"; print("✅ Part 2\n")
+    assert solution7.part2() == 24933642, "❌ Part 2"; print("✅ Part 2")
+    assert solution7.total_below(1000) == 584 and solution7.smallest_at_least(100000) == 24933642 \
+        and solution7.part2(update=50000000) == 48381165, "❌ Queries"; print("✅ Queries\n")
 
 #####################################
 ### Day 8: Treetop Tree House
@@ -404,72 +489,67 @@ if __name__ == "__main__":
 
 class Day8TreetopTreeHouse(object):
     def __init__(self, data: str):
-        self.data:List[List[int]] = [[int(x) for x in y] \
-            for y in data.strip().splitlines()]
-        self.length:int = len(self.data)
-        self.width:int = len(self.data[0])
+        import numpy as np
+        from aocgrid import Grid
+        self.heights:Any = Grid.parse(data).digits().astype(np.int8)
+        self.length:int = self.heights.shape[0]
+        self.width:int = self.heights.shape[1]
+
+    # both parts only ever look up the columns, once for each of the four
+    # rotations of the forest, so running maximums go down contiguous rows
+    def rotations(self) -> Iterator[Tuple[int, Any]]:
+        import numpy as np
+        for turn in range(4):
+            yield turn, np.ascontiguousarray(np.rot90(self.heights, turn))
+
+    @staticmethod
+    def visible_from_above(heights:Any) -> Any:
+        # taller than the running maximum of the trees above
+        import numpy as np
+        visible:Any = np.ones(heights.shape, bool)
+        visible[1:] = heights[1:] > np.maximum.accumulate(heights, axis=0)[:-1]
+        return visible
+
+    @staticmethod
+    def distance_up(heights:Any) -> Any:
+        # rows up to the last tree at least as tall: a monotonic stack per
+        # column, but with digit heights the stack is just the last row of
+        # each height or taller, so a whole row is resolved at once
+        import numpy as np
+        rows, columns = heights.shape
+        index:Any = np.min_scalar_type(rows)
+        distance:Any = np.zeros(heights.shape, index)
+        blocker:Any = np.zeros((10, columns), index)
+        every_column:Any = np.arange(columns)
+        levels:Any = np.arange(10, dtype=heights.dtype)[:, None]
+        for y in range(rows):
+            row:Any = heights[y]
+            distance[y] = y - blocker[row, every_column]
+            blocker[levels <= row] = y
+        return distance
 
     def part1(self) -> int:
-        tallest:int
-        visible:Set[str] = set()
-        for y in range(self.length):
-            tallest = -1
-            for x in range(self.width):
-                if (height := self.data[y][x]) > tallest:
-                    visible.add(f"{x},{y}")
-                    tallest = height
-        for y in range(self.length):
-            tallest = -1
-            for x in range(self.width - 1, -1, -1):
-                if (height := self.data[y][x]) > tallest:
-                    visible.add(f"{x},{y}")
-                    tallest = height
-        for x in range(self.width):
-            tallest = -1
-            for y in range(self.length):
-                if (height := self.data[y][x]) > tallest:
-                    visible.add(f"{x},{y}")
-                    tallest = height
-        for x in range(self.width):
-            tallest = -1
-            for y in range(self.length - 1, -1, -1):
-                if (height := self.data[y][x]) > tallest:
-                    visible.add(f"{x},{y}")
-                    tallest = height
-        return len(visible)
+        import numpy as np
+        seen:Any = np.zeros(self.heights.shape, bool)
+        for turn, heights in self.rotations():
+            seen |= np.rot90(self.visible_from_above(heights), -turn)
+        return int(seen.sum())
 
     def part2(self) -> int:
-        def get_score(x:int, y:int) -> int:
-            up = down = left = right = 0
-            size = self.data[y][x]
-            for i in range(x-1, -1, -1):
-                left += 1
-                if self.data[y][i] >= size:
-                    break
-            for i in range(x+1, self.length):
-                right += 1
-                if self.data[y][i] >= size:
-                    break
-            for i in range(y-1, -1, -1):
-                up += 1
-                if self.data[i][x] >= size:
-                    break
-            for i in range(y+1, self.width):
-                down += 1
-                if self.data[i][x] >= size:
-                    break
-            return up*left*down*right
-        return max(get_score(x, y) \
-                   for x in range(self.length) \
-                   for y in range(self.width))
+        import numpy as np
+        score:Any = np.ones(self.heights.shape, np.int64)
+        for turn, heights in self.rotations():
+            score *= np.rot90(self.distance_up(heights), -turn)
+        return int(score.max())
+
+input8: str = "30373\n" +\
+              "25512\n" +\
+              "65332\n" +\
+              "33549\n" +\
+              "35390\n"
 
 if __name__ == "__main__":
     print("[ Day 8 ]:")
-    input8: str = "30373\n" +\
-                  "25512\n" +\
-                  "65332\n" +\
-                  "33549\n" +\
-                  "35390\n"
     solution8 = Day8TreetopTreeHouse(input8)
     assert solution8.part1() == 21, "❌ Part 1"; print("✅ Part 1")
     assert solution8.part2() == 8,  "❌ Part 2"; print("✅ Part 2\n")
@@ -483,308 +563,296 @@ class Day9RopeBridge(object):
         self.data:List[Tuple[str,int]]= [(x,int(y)) for x,y in \
                 [z.split() for z in data.strip().splitlines()]]
 
-    def part1(self, start:complex) -> int:
-        head:complex = start
-        tail:complex = start
-        moves:Set[complex] = set([start])
-
-        for move in self.data:
-            match move:
-                case ('U', units): movement = 0 + -1j
-                case ('D', units): movement = 0 + 1j
-                case ('L', units): movement = -1 + 0j
-                case ('R', units): movement = 1 + 0j
-            for _ in range(units):
-                prev = head
-                head += movement
-                distance = (head - tail)
-                if abs(distance.real) <= 1 and \
-                        abs(distance.imag) <= 1:
-                    continue
-                elif head.real == tail.real or \
-                     head.imag == tail.imag:
-                    tail += movement
-                else:
-                    tail = prev
-                moves.add(tail)
-        return len(moves)
+    DIRECTIONS:Dict[str,Tuple[int,int]] = {"U": (0,-1), "D": (0,1), "L": (-1,0), "R": (1,0)}
+    BITMAP_CELLS:int = 8 # per step walked, sparser boxes keep the visits in a set
 
-    def part2(self, start:complex) -> int:
-        rope:List[complex] = [start] * 10
-        moves:Set[complex] = set([start])
+    def simulate(self, knots:int) -> int:
+        # knots never leave the box the head moves in, so tail visits are
+        # bits of a bitmap over that box when the walk fills it densely
+        # enough, and packed ints in a set otherwise
+        x:int = 0; y:int = 0
+        left:int = 0; right:int = 0; top:int = 0; bottom:int = 0
+        steps:int = 0
         for direction, units in self.data:
-            match direction:
-                case 'U': movement = 0 + -1j
-                case 'D': movement = 0 + 1j
-                case 'L': movement = -1 + 0j
-                case 'R': movement = 1 + 0j
-            for _ in range(units):
-                # move head
-                rope[0] += movement
-                for i in range(1, len(rope)):
-                    head = rope[i-1]
-                    distance = (rope[i] - head)
-                    if abs(distance.real) <= 1 and abs(distance.imag) <= 1:
-                        continue
-                    # update the position
-                    if rope[i].real == head.real:
-                        # x == x | move vertically
-                        if rope[i].imag < head.imag:
-                            rope[i] += (0 + 1j)
-                        else:
-                            rope[i] -= (0 + 1j)
-                    elif rope[i].imag == head.imag:
-                        # x == x | move horizontally
-                        if rope[i].real < head.real:
-                            rope[i] += (1 + 0j)
-                        else:
-                            rope[i] -= (1 + 0j)
-                    else:
-                        # move diagonally
-                        if rope[i].real < head.real:
-                            rope[i] += (1 + 0j)
-                        else:
-                            rope[i] -= (1 + 0j)
-                        if rope[i].imag < head.imag:
-                            rope[i] += (0 + 1j)
-                        else:
-                            rope[i] -= (0 + 1j)
-                moves.add(rope[9])
-                # self.draw_graph(start, rope)
-        return len(moves)
+            steps += units
+            dx, dy = self.DIRECTIONS[direction]
+            x += dx * units; y += dy * units
+            left, right = min(left, x), max(right, x)
+            top, bottom = min(top, y), max(bottom, y)
+        width:int = right - left + 1
+        height:int = bottom - top + 1
+        dense:bool = width * height <= self.BITMAP_CELLS * (steps + 1)
+        bitmap:Optional[bytearray] = bytearray((width * height + 7) // 8) if dense else None
+        visited:Set[int] = set()
+
+        def visit(x:int, y:int, dx:int=0, dy:int=0, run:int=1) -> None:
+            # the run starts at (x, y) and goes on in direction (dx, dy)
+            step:int = dy * width + dx
+            first:int = (y - top) * width + (x - left) + min(0, step * (run - 1))
+            cells:slice = slice(first, first + abs(step) * (run - 1) + 1, abs(step) or 1)
+            if bitmap is not None:
+                for cell in range(cells.start, cells.stop, cells.step):
+                    bitmap[cell >> 3] |= 1 << (cell & 7)
+            else:
+                visited.update(range(cells.start, cells.stop, cells.step))
 
-    @staticmethod
-    def draw_graph(start:complex, rope:List[complex]) -> None:
-        for y in range(30):
-            for x in range(30):
-                curr = complex(x,y)
-                if curr in rope:
-                    if rope.index(curr) == 0:
-                        print("H", end="")
-                    else:
-                        print(rope.index(curr), end="")
-                elif curr == start:
-                    print("s", end="")
+        xs:List[int] = [0] * knots
+        ys:List[int] = [0] * knots
+        visit(0, 0)
+        for direction, units in self.data:
+            dx, dy = self.DIRECTIONS[direction]
+            step:int = 0
+            while step < units:
+                xs[0] += dx; ys[0] += dy
+                step += 1
+                rigid:bool = True
+                for i in range(1, knots):
+                    ex:int = xs[i-1] - xs[i]
+                    ey:int = ys[i-1] - ys[i]
+                    if -1 <= ex <= 1 and -1 <= ey <= 1:
+                        break # this knot stays, so every knot behind it does
+                    mx:int = (ex > 0) - (ex < 0)
+                    my:int = (ey > 0) - (ey < 0)
+                    xs[i] += mx; ys[i] += my
+                    rigid = rigid and mx == dx and my == dy
                 else:
-                    print(".", end="")
-            print()
-        print()
-        input()
+                    visit(xs[-1], ys[-1])
+                    if rigid and step < units:
+                        # every knot moved with the head, so the rest of the
+                        # move slides the whole rope and the tail in a line
+                        run:int = units - step
+                        visit(xs[-1] + dx, ys[-1] + dy, dx, dy, run)
+                        for i in range(knots):
+                            xs[i] += dx * run; ys[i] += dy * run
+                        step = units
+        return int.from_bytes(bitmap, "little").bit_count() if bitmap is not None else len(visited)
+
+    def part1(self) -> int:
+        return self.simulate(2)
+
+    def part2(self) -> int:
+        return self.simulate(10)
+
+input9:str = "R 5\n" +\
+             "U 8\n" +\
+             "L 8\n" +\
+             "D 3\n" +\
+             "R 17\n" +\
+             "D 10\n" +\
+             "L 25\n" +\
+             "U 20\n"
 
 if __name__ == "__main__":
     print("[ Day 9 ]:")
-    input9:str = "R 5\n" +\
-                 "U 8\n" +\
-                 "L 8\n" +\
-                 "D 3\n" +\
-                 "R 17\n" +\
-                 "D 10\n" +\
-                 "L 25\n" +\
-                 "U 20\n"
-
     solution9 = Day9RopeBridge(input9)
-    assert solution9.part1(11 + 20j) == 88, "❌ Part 1"; print("✅ Part 1")
-    assert solution9.part2(11 + 15j) == 36, "❌ Part 2"; print("✅ Part 2\n")
+    assert solution9.part1() == 88, "❌ Part 1"; print("✅ Part 1")
+    assert solution9.part2() == 36, "❌ Part 2"; print("✅ Part 2")
+    assert Day9RopeBridge("R 4\nU 4\nL 3\nD 1\nR 4\nD 1\nL 5\nR 2\n").simulate(1) == 21, \
+        "❌ Knots"; print("✅ Knots\n")
 
 #####################################
 ### Day 10: Cathode-Ray Tube
 #####################################
 
+from bisect import bisect_right
+
 class Day10CathodeRayTube(object):
-    def __init__(self, data: str):
-        self.commands = deque([x for x in \
-            [z.split() for z in data.strip().splitlines()]])
+    SAMPLES:range = range(20, 221, 40)
 
-    def process(self) -> Tuple[int, str]:
-        cursor:List[int] = [0,1,2]
-        screen:List[str] = ["#"]+["."]*239
-        signal:int = 0
+    def __init__(self, data: str):
+        # compile the program once: instruction i starts on cycle starts[i]
+        # and X holds values[i] (the prefix sum of the addx deltas) while it
+        # runs, so nothing is consumed and every query can be asked again
+        self.starts:List[int] = []
+        self.values:List[int] = []
         cycle:int = 1
-        reg:Dict[str,int] = { "x": 1 }
-
-        def next_cycle() -> None:
-            nonlocal cycle, reg, screen, cursor, signal
-            if cycle in cursor:
-                screen[cycle] = "#"
-            cycle += 1
-            if cycle % 40 == 0:
-                cursor = [x + 40 for x in cursor]
-            if cycle in [20, 60, 100, 140, 180, 220]:
-                signal += cycle * reg["x"]
-
-        while self.commands:
-            op = self.commands.popleft()
-            match op:
+        x:int = 1
+        for line in data.splitlines():
+            match line.split():
                 case ["noop"]:
-                    next_cycle()
+                    self.starts.append(cycle); self.values.append(x)
+                    cycle += 1
                 case ["addx", num]:
-                    next_cycle()
-                    reg["x"] += int(num)
-                    cursor = [x + int(num) for x in cursor]
-                    next_cycle()
-
-        return signal, "".join(screen)
-
-        def print_screen():
-            nonlocal cursor, screen, reg
-            print(cycle, reg)
-            for y in range(6):
-                for x in range(40):
-                    if (y*40)+x in cursor:
-                        print("X", end="")
-                    else:
-                        print(screen[(y*40)+x], end="")
-                print()
+                    self.starts.append(cycle); self.values.append(x)
+                    cycle += 2
+                    x += int(num)
+        self.cycles:int = cycle - 1
+
+    def x_during(self, cycle:int) -> int:
+        return self.values[bisect_right(self.starts, cycle) - 1]
+
+    def signal_strength(self, cycles:Iterable[int]=SAMPLES) -> int:
+        return sum(cycle * self.x_during(cycle) for cycle in cycles if 1 <= cycle <= self.cycles)
+
+    def render(self, width:int=40, height:int=6) -> bytearray:
+        # pixel p is drawn during cycle p+1, lit when the sprite (X-1 to
+        # X+1) covers its column; the screen stays dark after the program
+        screen:bytearray = bytearray(b"." * (width * height))
+        i:int = 0
+        for pixel in range(min(width * height, self.cycles)):
+            while i + 1 < len(self.starts) and self.starts[i+1] <= pixel + 1:
+                i += 1
+            if -1 <= self.values[i] - pixel % width <= 1:
+                screen[pixel] = ord("#")
+        return screen
+
+    def process(self) -> Tuple[int, str]:
+        return self.signal_strength(), self.render().decode()
+
+    def print_screen(self, width:int=40, height:int=6) -> None:
+        screen:bytearray = self.render(width, height)
+        for y in range(height):
+            print(screen[y*width:(y+1)*width].decode())
+
+input10:str = "addx 15\n" +\
+              "addx -11\n" +\
+              "addx 6\n" +\
+              "addx -3\n" +\
+              "addx 5\n" +\
+              "addx -1\n" +\
+              "addx -8\n" +\
+              "addx 13\n" +\
+              "addx 4\n" +\
+              "noop\n" +\
+              "addx -1\n" +\
+              "addx 5\n" +\
+              "addx -1\n" +\
+              "addx 5\n" +\
+              "addx -1\n" +\
+              "addx 5\n" +\
+              "addx -1\n" +\
+              "addx 5\n" +\
+              "addx -1\n" +\
+              "addx -35\n" +\
+              "addx 1\n" +\
+              "addx 24\n" +\
+              "addx -19\n" +\
+              "addx 1\n" +\
+              "addx 16\n" +\
+              "addx -11\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 21\n" +\
+              "addx -15\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx -3\n" +\
+              "addx 9\n" +\
+              "addx 1\n" +\
+              "addx -3\n" +\
+              "addx 8\n" +\
+              "addx 1\n" +\
+              "addx 5\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx -36\n" +\
+              "noop\n" +\
+              "addx 1\n" +\
+              "addx 7\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 2\n" +\
+              "addx 6\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 1\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 7\n" +\
+              "addx 1\n" +\
+              "noop\n" +\
+              "addx -13\n" +\
+              "addx 13\n" +\
+              "addx 7\n" +\
+              "noop\n" +\
+              "addx 1\n" +\
+              "addx -33\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 2\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 8\n" +\
+              "noop\n" +\
+              "addx -1\n" +\
+              "addx 2\n" +\
+              "addx 1\n" +\
+              "noop\n" +\
+              "addx 17\n" +\
+              "addx -9\n" +\
+              "addx 1\n" +\
+              "addx 1\n" +\
+              "addx -3\n" +\
+              "addx 11\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 1\n" +\
+              "noop\n" +\
+              "addx 1\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx -13\n" +\
+              "addx -19\n" +\
+              "addx 1\n" +\
+              "addx 3\n" +\
+              "addx 26\n" +\
+              "addx -30\n" +\
+              "addx 12\n" +\
+              "addx -1\n" +\
+              "addx 3\n" +\
+              "addx 1\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx -9\n" +\
+              "addx 18\n" +\
+              "addx 1\n" +\
+              "addx 2\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 9\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx -1\n" +\
+              "addx 2\n" +\
+              "addx -37\n" +\
+              "addx 1\n" +\
+              "addx 3\n" +\
+              "noop\n" +\
+              "addx 15\n" +\
+              "addx -21\n" +\
+              "addx 22\n" +\
+              "addx -6\n" +\
+              "addx 1\n" +\
+              "noop\n" +\
+              "addx 2\n" +\
+              "addx 1\n" +\
+              "noop\n" +\
+              "addx -10\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "addx 20\n" +\
+              "addx 1\n" +\
+              "addx 2\n" +\
+              "addx 2\n" +\
+              "addx -6\n" +\
+              "addx -11\n" +\
+              "noop\n" +\
+              "noop\n" +\
+              "noop\n"
 
 if __name__ == "__main__":
     print("[ Day 10 ]:")
-    input10:str = "addx 15\n" +\
-                  "addx -11\n" +\
-                  "addx 6\n" +\
-                  "addx -3\n" +\
-                  "addx 5\n" +\
-                  "addx -1\n" +\
-                  "addx -8\n" +\
-                  "addx 13\n" +\
-                  "addx 4\n" +\
-                  "noop\n" +\
-                  "addx -1\n" +\
-                  "addx 5\n" +\
-                  "addx -1\n" +\
-                  "addx 5\n" +\
-                  "addx -1\n" +\
-                  "addx 5\n" +\
-                  "addx -1\n" +\
-                  "addx 5\n" +\
-                  "addx -1\n" +\
-                  "addx -35\n" +\
-                  "addx 1\n" +\
-                  "addx 24\n" +\
-                  "addx -19\n" +\
-                  "addx 1\n" +\
-                  "addx 16\n" +\
-                  "addx -11\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 21\n" +\
-                  "addx -15\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx -3\n" +\
-                  "addx 9\n" +\
-                  "addx 1\n" +\
-                  "addx -3\n" +\
-                  "addx 8\n" +\
-                  "addx 1\n" +\
-                  "addx 5\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx -36\n" +\
-                  "noop\n" +\
-                  "addx 1\n" +\
-                  "addx 7\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 2\n" +\
-                  "addx 6\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 1\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 7\n" +\
-                  "addx 1\n" +\
-                  "noop\n" +\
-                  "addx -13\n" +\
-                  "addx 13\n" +\
-                  "addx 7\n" +\
-                  "noop\n" +\
-                  "addx 1\n" +\
-                  "addx -33\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 2\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 8\n" +\
-                  "noop\n" +\
-                  "addx -1\n" +\
-                  "addx 2\n" +\
-                  "addx 1\n" +\
-                  "noop\n" +\
-                  "addx 17\n" +\
-                  "addx -9\n" +\
-                  "addx 1\n" +\
-                  "addx 1\n" +\
-                  "addx -3\n" +\
-                  "addx 11\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 1\n" +\
-                  "noop\n" +\
-                  "addx 1\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx -13\n" +\
-                  "addx -19\n" +\
-                  "addx 1\n" +\
-                  "addx 3\n" +\
-                  "addx 26\n" +\
-                  "addx -30\n" +\
-                  "addx 12\n" +\
-                  "addx -1\n" +\
-                  "addx 3\n" +\
-                  "addx 1\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx -9\n" +\
-                  "addx 18\n" +\
-                  "addx 1\n" +\
-                  "addx 2\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 9\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx -1\n" +\
-                  "addx 2\n" +\
-                  "addx -37\n" +\
-                  "addx 1\n" +\
-                  "addx 3\n" +\
-                  "noop\n" +\
-                  "addx 15\n" +\
-                  "addx -21\n" +\
-                  "addx 22\n" +\
-                  "addx -6\n" +\
-                  "addx 1\n" +\
-                  "noop\n" +\
-                  "addx 2\n" +\
-                  "addx 1\n" +\
-                  "noop\n" +\
-                  "addx -10\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "addx 20\n" +\
-                  "addx 1\n" +\
-                  "addx 2\n" +\
-                  "addx 2\n" +\
-                  "addx -6\n" +\
-                  "addx -11\n" +\
-                  "noop\n" +\
-                  "noop\n" +\
-                  "noop\n"
-
     solution10 = Day10CathodeRayTube(input10)
     solution10_part1, solution10_part2 = solution10.process()
     assert solution10_part1 == 13140, "❌ Part 1"; print("✅ Part 1")
@@ -794,196 +862,215 @@ if __name__ == "__main__":
                   "#####.....#####.....#####.....#####....." +\
                   "######......######......######......####" +\
                   "#######.......#######.......#######....."
-    assert solution10_part2 == screen_test, "❌ Part 2"; print("✅ Part 2\n")
+    assert solution10_part2 == screen_test, "❌ Part 2"; print("✅ Part 2")
+    assert solution10.process() == (13140, screen_test) and \
+           solution10.signal_strength([1, 20, 220, 241]) == 1 + 420 + 3960 and \
+           solution10.render(40, 3).decode() == screen_test[:120], \
+           "❌ Queries"; print("✅ Queries\n")
 
 #####################################
 ### Day 11: Monkey in the Middle
 #####################################
 
 import re
-from collections import deque
+from collections import Counter
 from functools import reduce
+from math import lcm
 from operator import mul
 
+SQUARE, MULTIPLY, ADD = range(3)
+
 class Monkey:
     def __init__(self) -> None:
-        self.items:deque[int] = deque()
-        self.inspect_count:int = 0
-        self.op:List[str] = []
+        self.items:List[int] = []
+        self.op:int = SQUARE
+        self.operand:int = 0
         self.test:int = 0
         self.pass_node:int = 0
         self.fail_node:int = 0
 
+    def compile(self, expression:str) -> None:
+        match expression.split():
+            case ["old", "*", "old"]: self.op, self.operand = SQUARE, 0
+            case ["old", "*", num]:   self.op, self.operand = MULTIPLY, int(num)
+            case ["old", "+", num]:   self.op, self.operand = ADD, int(num)
+            case _: raise ValueError(f"unknown operation {expression!r}")
+
 class Day11MonkeyInTheMiddle(object):
     def __init__(self, text:str):
-        self.monkies = []
+        self.monkies:List[Monkey] = []
+        for block in text.strip().split("\n\n"):
+            lines:List[str] = block.splitlines()
+            monkey = Monkey()
+            monkey.items = list(map(int, re.findall(r"\d+", lines[1])))
+            monkey.compile(lines[2].split("=")[1])
+            monkey.test = int(re.findall(r"\d+", lines[3])[0])
+            monkey.pass_node = int(re.findall(r"\d+", lines[4])[0])
+            monkey.fail_node = int(re.findall(r"\d+", lines[5])[0])
+            self.monkies.append(monkey)
+        # every test divides the lcm, so worry mod lcm keeps every throw the same
+        self.modulus:int = lcm(*(monkey.test for monkey in self.monkies))
+
+    def inspections(self, rounds:int, relief:int=1, skip_cycles:bool=True) -> List[int]:
+        # items never interact, so each one is followed on its own for all
+        # rounds; a throw to a lower numbered monkey waits for the next round
+        ops:List[int] = [monkey.op for monkey in self.monkies]
+        operands:List[int] = [monkey.operand for monkey in self.monkies]
+        tests:List[int] = [monkey.test for monkey in self.monkies]
+        passes:List[int] = [monkey.pass_node for monkey in self.monkies]
+        fails:List[int] = [monkey.fail_node for monkey in self.monkies]
+        modulus:int = self.modulus
+        counts:List[int] = [0] * len(self.monkies)
+        # without relief the worry mod lcm keeps an item to a finite set of
+        # (monkey, worry) states, so its rounds must eventually repeat
+        detect:bool = skip_cycles and relief == 1
+        for start, monkey in enumerate(self.monkies):
+            for worry in monkey.items:
+                current:int = start
+                done:int = 0
+                # round each state was first seen at, and a bitmask of the
+                # monkeys that inspected the item in every round so far (it
+                # only ever moves up within a round, so each at most once)
+                seen:Dict[Tuple[int,int],int] = {}
+                masks:List[int] = []
+                mask:int = 0
+                while done < rounds:
+                    counts[current] += 1
+                    mask |= 1 << current
+                    op:int = ops[current]
+                    if op == SQUARE:     worry = worry * worry
+                    elif op == MULTIPLY: worry = worry * operands[current]
+                    else:                worry = worry + operands[current]
+                    worry = worry % modulus if relief == 1 else worry // relief
+                    target:int = passes[current] if worry % tests[current] == 0 else fails[current]
+                    if target < current:
+                        done += 1
+                        if detect:
+                            masks.append(mask)
+                            if (state := (target, worry)) in seen:
+                                # rounds first..done repeat from here on, so
+                                # add whole periods and then a partial one
+                                first:int = seen[state]
+                                cycles, extra = divmod(rounds - done, done - first)
+                                self.extrapolate(counts, masks[first:done], cycles)
+                                self.extrapolate(counts, masks[first:first + extra], 1)
+                                break
+                            seen[state] = done
+                        mask = 0
+                    current = target
+        return counts
 
-        def readlines(data:str) -> Iterator[str]:
-            i = 0
-            lines = data.strip().splitlines()
-            while i < len(lines):
-                yield lines[i]
-                i += 1
-            yield None # type: ignore
-
-        lines = readlines(text)
-
-        while (line := next(lines)) != None:
-            if line.startswith("Monkey"):
-                monkey = Monkey()
-                monkey.items = deque(map(int, re.findall("\d{1,}", next(lines))))
-                monkey.op = re.search("Operation: new = (.*)", next(lines))[1].split(" ") # type: ignore
-                monkey.test = int(re.search("\d{1,}", next(lines))[0]) # type: ignore
-                monkey.pass_node = int(re.search("\d{1,}", next(lines))[0]) # type: ignore
-                monkey.fail_node = int(re.search("\d{1,}", next(lines))[0]) # type: ignore
-                self.monkies.append(monkey)
-
-    def part1(self) -> int:
-        monkies = deepcopy(self.monkies)
-        def process_monkey(monkey:Monkey) -> None:
-            while monkey.items:
-                new:int
-                old:int = monkey.items.popleft()
-                match monkey.op:
-                    case ["old", "*", "old"]: new = old * old
-                    case ["old", "*", num]:   new = old * int(num)
-                    case ["old", "+", num]:   new = old + int(num)
-                monkey.inspect_count += 1
-                new = new // 3
-                if new % monkey.test == 0:
-                    monkies[monkey.pass_node].items.append(new)
-                else:
-                    monkies[monkey.fail_node].items.append(new)
-        for _ in range(20):
-            for monkey in monkies:
-                process_monkey(monkey)
-        return reduce(mul, (sorted([monkey.inspect_count \
-            for monkey in monkies], reverse=True)[:2]))
+    @staticmethod
+    def extrapolate(counts:List[int], masks:List[int], times:int) -> None:
+        for mask, n in Counter(masks).items():
+            for monkey in range(len(counts)):
+                if mask >> monkey & 1:
+                    counts[monkey] += n * times
 
-    def part2(self) -> int:
-        monkies = deepcopy(self.monkies)
-        def process_monkey(monkey:Monkey) -> None:
-            while monkey.items:
-                new:int
-                old:int = monkey.items.popleft()
-                match monkey.op:
-                    case ["old", "*", "old"]: new = old * old
-                    case ["old", "*", num]:   new = old * int(num)
-                    case ["old", "+", num]:   new = old + int(num)
-                monkey.inspect_count += 1
-                # new = new % 9699690
-                new = new % 96577
-                if new % monkey.test == 0:
-                    monkies[monkey.pass_node].items.append(new)
-                else:
-                    monkies[monkey.fail_node].items.append(new)
-        for _ in range(10000):
-            for monkey in monkies:
-                process_monkey(monkey)
-        return reduce(mul, (sorted([monkey.inspect_count \
-            for monkey in monkies], reverse=True)[:2]))
+    @staticmethod
+    def monkey_business(counts:List[int]) -> int:
+        return reduce(mul, sorted(counts, reverse=True)[:2])
+
+    def part1(self, rounds:int=20) -> int:
+        return self.monkey_business(self.inspections(rounds, relief=3))
+
+    def part2(self, rounds:int=10000) -> int:
+        return self.monkey_business(self.inspections(rounds))
+
+input11:str = "Monkey 0:\n" +\
+              "  Starting items: 79, 98\n" +\
+              "  Operation: new = old * 19\n" +\
+              "  Test: divisible by 23\n" +\
+              "    If true: throw to monkey 2\n" +\
+              "    If false: throw to monkey 3\n\n" +\
+              "Monkey 1:\n" +\
+              "  Starting items: 54, 65, 75, 74\n" +\
+              "  Operation: new = old + 6\n" +\
+              "  Test: divisible by 19\n" +\
+              "    If true: throw to monkey 2\n" +\
+              "    If false: throw to monkey 0\n\n" +\
+              "Monkey 2:\n" +\
+              "  Starting items: 79, 60, 97\n" +\
+              "  Operation: new = old * old\n" +\
+              "  Test: divisible by 13\n" +\
+              "    If true: throw to monkey 1\n" +\
+              "    If false: throw to monkey 3\n\n" +\
+              "Monkey 3:\n" +\
+              "  Starting items: 74\n" +\
+              "  Operation: new = old + 3\n" +\
+              "  Test: divisible by 17\n" +\
+              "    If true: throw to monkey 0\n" +\
+              "    If false: throw to monkey 1\n\n"
 
 if __name__ == "__main__":
     print("[ Day 11 ]:")
-    input11:str = "Monkey 0:\n" +\
-                  "  Starting items: 79, 98\n" +\
-                  "  Operation: new = old * 19\n" +\
-                  "  Test: divisible by 23\n" +\
-                  "    If true: throw to monkey 2\n" +\
-                  "    If false: throw to monkey 3\n\n" +\
-                  "Monkey 1:\n" +\
-                  "  Starting items: 54, 65, 75, 74\n" +\
-                  "  Operation: new = old + 6\n" +\
-                  "  Test: divisible by 19\n" +\
-                  "    If true: throw to monkey 2\n" +\
-                  "    If false: throw to monkey 0\n\n" +\
-                  "Monkey 2:\n" +\
-                  "  Starting items: 79, 60, 97\n" +\
-                  "  Operation: new = old * old\n" +\
-                  "  Test: divisible by 13\n" +\
-                  "    If true: throw to monkey 1\n" +\
-                  "    If false: throw to monkey 3\n\n" +\
-                  "Monkey 3:\n" +\
-                  "  Starting items: 74\n" +\
-                  "  Operation: new = old + 3\n" +\
-                  "  Test: divisible by 17\n" +\
-                  "    If true: throw to monkey 0\n" +\
-                  "    If false: throw to monkey 1\n\n"
     solution11 = Day11MonkeyInTheMiddle(input11)
     assert solution11.part1() == 10605, "❌ Part 1"; print("✅ Part 1")
-    assert solution11.part2() == 2713310158, "❌ Part 2"; print("✅ Part 2\n")
+    assert solution11.part2() == 2713310158, "❌ Part 2"; print("✅ Part 2")
+    assert solution11.modulus == 96577 and solution11.part2() == 2713310158 and \
+           solution11.inspections(20) == [99, 97, 8, 103], "❌ Trajectories"; print("✅ Trajectories")
+    assert solution11.inspections(12345) == solution11.inspections(12345, skip_cycles=False) and \
+           solution11.part2(10**12) > 0, "❌ Cycles"; print("✅ Cycles\n")
 
 #####################################
 ### Day 12: Hill Climbing Algorithm
 #####################################
 
-from heapq import heappop, heappush
+if TYPE_CHECKING:
+    from aocgrid import Grid
 
 class Day12HillClimbingAlgorithm(object):
+    BORDER:int = ord("~")
+
     def __init__(self, data:str):
-        self.maze = [[*x] for x in data.strip().splitlines()]
-        self.height, self.width = len(self.maze), len(self.maze[0])
-        self.start = self.end = (0,0)
-
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.maze[y][x] == "S":
-                    self.start = (x,y)
-                    self.maze[y][x] = "a"
-                if self.maze[y][x] == "E":
-                    self.end = (x,y)
-                    self.maze[y][x] = "{"
+        from aocgrid import Grid
+        # flat heights with a border higher than any hill, S at height a
+        # and E at height z
+        self.grid:Grid = Grid.parse(data).padded(chr(self.BORDER))
+        self.start:int = self.grid.buffer.find(b"S")
+        self.end:int = self.grid.buffer.find(b"E")
+        self.grid.buffer[self.start] = ord("a")
+        self.grid.buffer[self.end] = ord("z")
+        self.field:Any = None
+
+    def distances(self) -> Any:
+        from aocgrid import shortest_paths
+        import numpy as np
+        # steps from every square to E (-1 where E is out of reach), from one
+        # bfs walking down from E that every later query shares
+        if self.field is None:
+            heights:bytearray = self.grid.buffer
+            distance, _ = shortest_paths(len(heights), [self.end], self.grid.offsets(),
+                lambda node, step: heights[node] - 1 <= heights[step] < self.BORDER)
+            self.field = np.frombuffer(distance, np.int64).reshape(self.grid.cells.shape)[1:-1, 1:-1]
+        return self.field
+
+    def distance(self, y:int, x:int) -> int:
+        return int(self.distances()[y, x])
 
     def part1(self) -> int:
-        path:Dict[Tuple[int,int],Optional[Tuple[int,int]]] = {self.start:None}
-        costs:Dict[Tuple[int,int],int] = {self.start: 0}
-        queue:List[Tuple[int, Tuple[int,int]]] = [(0, self.start)]
-        while queue:
-            cost, current = heappop(queue)
-            x, y = current
-            for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                mx, my = x + dx, y + dy
-                if not (0 <= mx < self.width and 0 <= my < self.height):
-                    continue
-                if (mx, my) in costs:
-                    continue
-                if ord(self.maze[my][mx]) - ord(self.maze[y][x]) > 1:
-                    continue
-                heappush(queue, (cost + 1, (mx, my)))
-                costs[(mx, my)] = cost + 1
-                path[(mx, my)] = current
-        return costs[self.end]
+        y, x = self.grid.position(self.start)
+        return self.distance(y - 1, x - 1)
 
     def part2(self) -> int:
-        self.start, self.end = self.end, self.start
-        visited:Set[Tuple[int,int]] = set()
-        queue:deque[Tuple[Tuple[int,int], int]] = deque([(self.start, 0)])
-        while queue:
-            [x, y], steps = queue.popleft()
-            if self.maze[y][x] == 'a':
-                return steps
-            for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                mx, my = x + dx, y + dy
-                if not (0 <= mx < self.width and 0 <= my < self.height):
-                    continue
-                if (mx, my) in visited:
-                    continue
-                if ord(self.maze[y][x]) - ord(self.maze[my][mx]) > 1:
-                    continue
-                queue.append(((mx, my), steps + 1))
-                visited.add((mx, my))
-        return -1
+        field = self.distances()
+        lowest = (self.grid.cells[1:-1, 1:-1] == ord("a")) & (field >= 0)
+        return int(field[lowest].min()) if lowest.any() else -1
+
+input12:str = "Sabqponm\n" +\
+              "abcryxxl\n" +\
+              "accszExk\n" +\
+              "acctuvwj\n" +\
+              "abdefghi\n"
 
 if __name__ == "__main__":
     print("[ Day 12 ]:")
-    input12:str = "Sabqponm\n" +\
-                  "abcryxxl\n" +\
-                  "accszExk\n" +\
-                  "acctuvwj\n" +\
-                  "abdefghi\n"
     solution12 = Day12HillClimbingAlgorithm(input12)
     assert solution12.part1() == 31, "❌ Part 1"; print("✅ Part 1")
-    assert solution12.part2() == 29, "❌ Part 2"; print("✅ Part 2\n")
+    assert solution12.part2() == 29, "❌ Part 2"; print("✅ Part 2")
+    assert solution12.part1() == 31 and solution12.part2() == 29, "❌ Repeat"; print("✅ Repeat")
+    assert solution12.distance(2, 5) == 0 and solution12.distance(4, 0) == 29 and solution12.distance(0, 0) == 31 and \
+           solution12.distances().shape == (5, 8), "❌ Distances"; print("✅ Distances\n")
 
 #####################################
 ### Day 13: Distress Signal
@@ -1053,24 +1140,25 @@ class Day13DistressSignal(object):
         return None
 
 
+input13:str = "[1,1,3,1,1]\n" +\
+              "[1,1,5,1,1]\n\n" +\
+              "[[1],[2,3,4]]\n" +\
+              "[[1],4]\n\n" +\
+              "[9]\n" +\
+              "[[8,7,6]]\n\n" +\
+              "[[4,4],4,4]\n" +\
+              "[[4,4],4,4,4]\n\n" +\
+              "[7,7,7,7]\n" +\
+              "[7,7,7]\n\n" +\
+              "[]\n" +\
+              "[3]\n\n" +\
+              "[[[]]]\n" +\
+              "[[]]\n\n" +\
+              "[1,[2,[3,[4,[5,6,7]]]],8,9]\n" +\
+              "[1,[2,[3,[4,[5,6,0]]]],8,9]\n\n"
+
 if __name__ == "__main__":
     print("[ Day 13 ]:")
-    input13:str = "[1,1,3,1,1]\n" +\
-                  "[1,1,5,1,1]\n\n" +\
-                  "[[1],[2,3,4]]\n" +\
-                  "[[1],4]\n\n" +\
-                  "[9]\n" +\
-                  "[[8,7,6]]\n\n" +\
-                  "[[4,4],4,4]\n" +\
-                  "[[4,4],4,4,4]\n\n" +\
-                  "[7,7,7,7]\n" +\
-                  "[7,7,7]\n\n" +\
-                  "[]\n" +\
-                  "[3]\n\n" +\
-                  "[[[]]]\n" +\
-                  "[[]]\n\n" +\
-                  "[1,[2,[3,[4,[5,6,7]]]],8,9]\n" +\
-                  "[1,[2,[3,[4,[5,6,0]]]],8,9]\n\n"
     solution13 = Day13DistressSignal(input13)
     assert solution13.part1() == 13,  "❌ Part 1"; print("✅ Part 1")
     assert solution13.part2() == 140, "❌ Part 2"; print("✅ Part 2\n")
@@ -1083,60 +1171,54 @@ import re
 
 class Day14RegolithReservoir(object):
     def __init__(self, text:str):
-        self.sand:Set[Tuple[int,int]] = set()
-        self.ground:Set[Tuple[int,int]]  = set()
-        self.has_floor:bool = False
+        from aocgrid import Grid
         self.start:Tuple[int,int] = (500, 0)
 
         # parse
         data = text.strip().splitlines()
         paths = [[list(map(int,y.split(","))) for y in
-          re.findall("\d+,\d+", x)] for x in data]
+          re.findall(r"\d+,\d+", x)] for x in data]
 
-        # get width and height
+        # get width and height, sand piles up to the floor at most
+        # height cells either side of the start
         flatten = [x for sub in paths for x in sub]
         xs, ys = list(zip(*flatten))
-        xs = sorted([*xs]) # type:ignore
-        ys = sorted([*ys]) # type:ignore
-        self.height, self.width = ys[-1] + 2, xs[-1] + 2
+        self.height:int = max(ys) + 2
+        self.left:int = min(min(xs), 500 - self.height) - 1
+        self.width:int = max(max(xs), 500 + self.height) - self.left + 2
 
-        # add paths
+        # add paths, one slice per segment
+        self.cave:Grid = Grid.blank(self.height + 1, self.width, ".")
         for lines in paths:
-            x1, y1 = lines.pop(0)
-            self.ground.add((x1,y1))
-            while lines:
-                x2, y2 = lines.pop(0)
-                while x1 != x2 or y1 != y2:
-                    if   x1 < x2: x1 += 1
-                    elif x1 > x2: x1 -= 1
-                    elif y1 < y2: y1 += 1
-                    elif y1 > y2: y1 -= 1
-                    self.ground.add((x1,y1))
-
-    def is_falling(self, x:int, y:int) -> bool:
-        if self.has_floor:
-            return (y != self.height) and \
-                   (x, y) not in self.ground and \
-                   (x, y) not in self.sand
-        return (x, y) not in self.ground and \
-               (x, y) not in self.sand
+            for (x1, y1), (x2, y2) in zip(lines, lines[1:]):
+                x1, x2 = sorted((x1 - self.left, x2 - self.left))
+                y1, y2 = sorted((y1, y2))
+                self.cave.cells[y1:y2+1, x1:x2+1] = ord("#")
+        self.sand:Grid = self.cave
 
     def count_sand(self, has_floor:bool) -> int:
-        x, y = self.start
-        self.sand = set()
-        self.has_floor = has_floor
-
+        self.sand = self.cave.copy()
+        self.sand.cells[self.height] = ord("#" if has_floor else ".")
+        cells:bytearray = self.sand.buffer
+        width:int = self.width
+        empty:int = ord(".")
+        start:int = self.sand.index(self.start[1], self.start[0] - self.left)
+        bottom:int = self.sand.index(self.height, 0)
+        count:int = 0
+
+        i:int = start
         while True:
-            if not has_floor and y == self.height:
-                return len(self.sand) # part 1
-            elif self.is_falling(x,  y+1): y += 1
-            elif self.is_falling(x-1,y+1): x, y = x-1, y+1
-            elif self.is_falling(x+1,y+1): x, y = x+1, y+1
-            elif (x, y) == self.start:
-                return len(self.sand) + 1 # part 2
+            if i >= bottom:
+                return count # part 1
+            elif cells[i+width]   == empty: i += width
+            elif cells[i+width-1] == empty: i += width - 1
+            elif cells[i+width+1] == empty: i += width + 1
+            elif i == start:
+                return count + 1 # part 2
             else:
-                self.sand.add((x, y))
-                x, y = self.start
+                cells[i] = ord("o")
+                count += 1
+                i = start
 
     def part1(self) -> int:
         return self.count_sand(False)
@@ -1145,18 +1227,15 @@ class Day14RegolithReservoir(object):
         return self.count_sand(True)
 
     def draw_cave(self) -> None:
-        for y in range(40, 49):
-            for x in range(518, 600):
-                if (x,y) in self.ground: print("#", end="")
-                elif (x,y) in self.sand: print("o", end="")
-                else: print(".", end="")
-            print()
+        for row in self.sand.cells[40:49, 518-self.left:600-self.left]:
+            print(bytes(row).decode())
         input()
 
+input14 = "498,4 -> 498,6 -> 496,6\n" +\
+          "503,4 -> 502,4 -> 502,9 -> 494,9"
+
 if __name__ == "__main__":
     print("[ Day 14 ]:")
-    input14 = "498,4 -> 498,6 -> 496,6\n" +\
-              "503,4 -> 502,4 -> 502,9 -> 494,9"
     solution14 = Day14RegolithReservoir(input14)
     assert solution14.part1() == 24, "❌ Part 1"; print("✅ Part 1")
     assert solution14.part2() == 93, "❌ Part 2"; print("✅ Part 2\n")
@@ -1252,22 +1331,23 @@ class Day15BeaconExclusionZone(object):
         x, y = intersecs.pop() or (0,0)
         return (x * 4000000) + y
 
+input15:str = "Sensor at x=2, y=18: closest is at x=-2, y=15\n" +\
+              "Sensor at x=9, y=16: closest beacon is at x=10, y=16\n" +\
+              "Sensor at x=13, y=2: closest beacon is at x=15, y=3\n" +\
+              "Sensor at x=12, y=14: beacon is at x=10, y=16\n" +\
+              "Sensor at x=10, y=20: closest beacon is at x=10, y=16\n" +\
+              "Sensor at x=14, y=17: closest beacon is at x=10, y=16\n" +\
+              "Sensor at x=8, y=7: closest beacon is at x=2, y=10\n" +\
+              "Sensor at x=2, y=0: closest beacon is at x=2, y=10\n" +\
+              "Sensor at x=0, y=11: closest beacon is at x=2, y=10\n" +\
+              "Sensor at x=20, y=14: closest beacon is at x=25, y=17\n" +\
+              "Sensor at x=17, y=20: closest beacon is at x=21, y=22\n" +\
+              "Sensor at x=16, y=7: closest beacon is at x=15, y=3\n" +\
+              "Sensor at x=14, y=3: closest beacon is at x=15, y=3\n" +\
+              "Sensor at x=20, y=1: closest beacon is at x=15, y=3\n"
+
 if __name__ == "__main__":
     print("[ Day 15 ]:")
-    input15:str = "Sensor at x=2, y=18: closest is at x=-2, y=15\n" +\
-                  "Sensor at x=9, y=16: closest beacon is at x=10, y=16\n" +\
-                  "Sensor at x=13, y=2: closest beacon is at x=15, y=3\n" +\
-                  "Sensor at x=12, y=14: beacon is at x=10, y=16\n" +\
-                  "Sensor at x=10, y=20: closest beacon is at x=10, y=16\n" +\
-                  "Sensor at x=14, y=17: closest beacon is at x=10, y=16\n" +\
-                  "Sensor at x=8, y=7: closest beacon is at x=2, y=10\n" +\
-                  "Sensor at x=2, y=0: closest beacon is at x=2, y=10\n" +\
-                  "Sensor at x=0, y=11: closest beacon is at x=2, y=10\n" +\
-                  "Sensor at x=20, y=14: closest beacon is at x=25, y=17\n" +\
-                  "Sensor at x=17, y=20: closest beacon is at x=21, y=22\n" +\
-                  "Sensor at x=16, y=7: closest beacon is at x=15, y=3\n" +\
-                  "Sensor at x=14, y=3: closest beacon is at x=15, y=3\n" +\
-                  "Sensor at x=20, y=1: closest beacon is at x=15, y=3\n"
     solution15 = Day15BeaconExclusionZone(input15)
     assert solution15.part1() == 26, "❌ Part 1"; print("✅ Part 1")
     assert solution15.part2() == 56000011, "❌ Part 2"; print("✅ Part 2\n")
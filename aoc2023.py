@@ -1,32 +1,19 @@
 #!/usr/bin/env python3
 
 import re
-import requests
+from collections import defaultdict
 from os import system
 from time import sleep
 from datetime import datetime
+from functools import reduce
+from operator import mul
 
-print()
-print("##########################")
-print("### ⭐🎄 AOC 2023 🎄⭐ ###")
-print("##########################")
-print()
+SESSION = "" # read by ./aoc.py run when AOC_SESSION is unset
 
-SESSION = ""
-
-def get_input(session, year, day):
-    cookies = {"session": session}
-    request = requests.get(f"https://adventofcode.com/{year}/day/{day}/input", cookies=cookies)
-    return request.text
-
-data = get_input(SESSION, 2023, 1)
-
-print("Day 1:", end="")
-
-data = "1abc2\n" +\
-       "pqr3stu8vwx\n" +\
-       "a1b2c3d4e5f\n"+\
-       "treb7uchet\n"
+input1 = "1abc2\n" +\
+         "pqr3stu8vwx\n" +\
+         "a1b2c3d4e5f\n"+\
+         "treb7uchet\n"
 
 def Day1Part1(data):
     total = 0
@@ -34,15 +21,14 @@ def Day1Part1(data):
         num = re.sub(r"[a-z]", "", num)
         total += int(f"{num[0]}{num[-1]}") if num else 0
     return total
-assert Day1Part1(data) == 142, "❌"; print(" ⭐", end="")
 
-data = "two1nine\n" +\
-       "eightwothree\n" +\
-       "abcone2threexyz\n" +\
-       "xtwone3four\n" +\
-       "4nineeightseven2\n" +\
-       "zoneight234\n" +\
-       "7pqrstsixteen"
+input1_part2 = "two1nine\n" +\
+               "eightwothree\n" +\
+               "abcone2threexyz\n" +\
+               "xtwone3four\n" +\
+               "4nineeightseven2\n" +\
+               "zoneight234\n" +\
+               "7pqrstsixteen"
 
 def Day1Part2(data):
     DIGITS = ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
@@ -83,15 +69,22 @@ def Day1Part2(data):
         last_digit = get_first(line[::-1], backward_trie, True)
         total += first_digit * 10 + last_digit
     return total
-assert Day1Part2(data) == 281, "❌"; print(" ⭐\n")
 
-print("🎄 Day 2:", end="")
+if __name__ == "__main__":
+    print()
+    print("##########################")
+    print("### ⭐🎄 AOC 2023 🎄⭐ ###")
+    print("##########################")
+    print()
+    print("Day 1:", end="")
+    assert Day1Part1(input1) == 142, "❌"; print(" ⭐", end="")
+    assert Day1Part2(input1_part2) == 281, "❌"; print(" ⭐\n")
 
-data = "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green\n" +\
-       "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue\n" +\
-       "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red\n" +\
-       "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red\n" +\
-       "Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green"
+input2 = "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green\n" +\
+         "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue\n" +\
+         "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red\n" +\
+         "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red\n" +\
+         "Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green"
 
 def Day2Part1(data):
     total = 0
@@ -104,13 +97,6 @@ def Day2Part1(data):
         if counts["red"] <= 12 and counts["green"] <= 13 and counts["blue"] <= 14:
             total += int(number)
     return total
-assert Day2Part1(data) == 8, "❌"; print(" ⭐", end="")
-
-data = "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green\n" +\
-       "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue\n" +\
-       "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red\n" +\
-       "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red\n" +\
-       "Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green"
 
 def Day2Part2(data):
     total = 0
@@ -122,20 +108,22 @@ def Day2Part2(data):
             counts[color] = max(counts[color], int(amount))
         total += counts['red'] * counts['green'] * counts['blue']
     return total
-assert Day2Part2(data) == 2286, "❌"; print(" ⭐\n")
 
-print("🎄 Day 3:", end="")
+if __name__ == "__main__":
+    print("🎄 Day 2:", end="")
+    assert Day2Part1(input2) == 8, "❌"; print(" ⭐", end="")
+    assert Day2Part2(input2) == 2286, "❌"; print(" ⭐\n")
 
-data = "467..114..\n" +\
-       "...*......\n" +\
-       "..35..633.\n" +\
-       "......#...\n" +\
-       "617*......\n" +\
-       ".....+.58.\n" +\
-       "..592.....\n" +\
-       "......755.\n" +\
-       "...$.*....\n" +\
-       ".664.598.."
+input3 = "467..114..\n" +\
+         "...*......\n" +\
+         "..35..633.\n" +\
+         "......#...\n" +\
+         "617*......\n" +\
+         ".....+.58.\n" +\
+         "..592.....\n" +\
+         "......755.\n" +\
+         "...$.*....\n" +\
+         ".664.598.."
 
 def Day3Part1(data):
     total = 0
@@ -163,7 +151,6 @@ def Day3Part1(data):
         if number and valid:
             total += int(number)
     return total
-assert Day3Part1(data) == 4361, "❌"; print(" ⭐", end="")
 
 def Day3Part2(data):
     total = 0
@@ -194,11 +181,13 @@ def Day3Part2(data):
         if number and valid:
             valid_numbers[valid].append(number)
     return sum(int(x[0]) * int(x[1]) for x in valid_numbers.values() if len(x) == 2)
-assert Day3Part2(data) == 467835, "❌"; print(" ⭐\n")
 
-print("🎄 Day 4:", end="")
+if __name__ == "__main__":
+    print("🎄 Day 3:", end="")
+    assert Day3Part1(input3) == 4361, "❌"; print(" ⭐", end="")
+    assert Day3Part2(input3) == 467835, "❌"; print(" ⭐\n")
 
-data = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+input4 = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
 Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
 Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
 Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83
@@ -218,7 +207,6 @@ def Day4Part1(data):
             continue
         total += 2**(len(winning_picks)-1)
     return total
-assert Day4Part1(data) == 13, "❌"; print(" ⭐", end="")
 
 def Day4Part2(data):
     lines = data.splitlines()
@@ -234,11 +222,17 @@ def Day4Part2(data):
         for i in range(index+1, index + len(winning_picks) + 1):
             count[i] += count[index]
     return sum(count.values())
-assert Day4Part2(data) == 30, "❌"; print(" ⭐\n")
 
-print("🎄 Day 6:", end="")
+if __name__ == "__main__":
+    print("🎄 Day 4:", end="")
+    assert Day4Part1(input4) == 13, "❌"; print(" ⭐", end="")
+    assert Day4Part2(input4) == 30, "❌"; print(" ⭐\n")
 
-def Day6():
+input6 = """Time:      7  15   30
+Distance:  9  40  200
+"""
+
+def Day6(data):
     def get_wins(time, distance):
         count = 0
         for v in range(time):
@@ -246,20 +240,24 @@ def Day6():
             if traveled > distance:
                 count += 1
         return count
-    p1 = get_wins(7, 9) * get_wins(15, 40) * get_wins(30, 200)
-    p2 = get_wins(71530, 940200)
+    times, distances = [re.findall(r"\d+", line) for line in data.strip().splitlines()]
+    p1 = reduce(mul, (get_wins(int(t), int(d)) for t, d in zip(times, distances)))
+    p2 = get_wins(int("".join(times)), int("".join(distances)))
+    return (p1, p2)
+
+if __name__ == "__main__":
+    print("🎄 Day 6:", end="")
+    p1, p2 = Day6(input6)
     assert p1 == 288, "❌"; print(" ⭐", end="")
     assert p2 == 71503 , "❌"; print(" ⭐\n")
-Day6()
-
-print("🎄 Day 9:", end="")
 
-data = """
+input9 = """
 0 3 6 9 12 15
 1 3 6 10 15 21
 10 13 16 21 30 45
 """
-def Day9():
+
+def Day9(data):
     def solve(data, reverse=False):
         lines = data.strip().split("\n")
         lines = [line.strip().split(" ") for line in lines]
@@ -284,6 +282,10 @@ def Day9():
         return sum(totals.values())
     p1 = solve(data)
     p2 = solve(data, reverse=True)
+    return (p1, p2)
+
+if __name__ == "__main__":
+    print("🎄 Day 9:", end="")
+    p1, p2 = Day9(input9)
     assert p1 == 114, "❌"; print(" ⭐", end="")
     assert p2 == 2 , "❌"; print(" ⭐\n")
-Day9()
@@ -3,38 +3,14 @@
 import re
 import os
 import math
-import requests
 from time import sleep
 from datetime import datetime
 from heapq import heappush, heappop
 from collections import Counter, defaultdict
 from functools import cache, reduce
 from operator import mul
-import numpy as np
 
-print()
-print("##########################")
-print("### ⭐🎄 AOC 2024 🎄⭐ ###")
-print("##########################")
-print()
-
-SESSION = ""
-
-def get_input(session, year, day):
-    if f"{year}_{day}.txt" in os.listdir():
-        with open(f"{year}_{day}.txt", "r") as f:
-            return f.read()
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
-    headers = {
-        "cookie": f"session={session}"
-    }
-    response = requests.get(url, headers=headers)
-    print(response)
-    with open(f"{year}_{day}.txt", "w") as f:
-        f.write(response.text)
-    return response.text
-
-data = get_input(SESSION, 2024, 2)
+SESSION = "" # read by ./aoc.py run when AOC_SESSION is unset
 
 def Day1(data):
     silver = gold = 0
@@ -50,7 +26,7 @@ def Day1(data):
         silver += abs(a - b)
         gold += a * bfreq[a]
     return (silver, gold)
-data = """
+input1 = """
 3   4
 4   3
 2   5
@@ -58,8 +34,15 @@ data = """
 3   9
 3   3
 """
-print("Day 1:", end="")
-assert Day1(data) == (11, 31), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print()
+    print("##########################")
+    print("### ⭐🎄 AOC 2024 🎄⭐ ###")
+    print("##########################")
+    print()
+    print("Day 1:", end="")
+    assert Day1(input1) == (11, 31), "❌"; print(" ⭐ ⭐")
 
 def Day2(data):
     silver = gold = 0
@@ -81,7 +64,7 @@ def Day2(data):
         elif remove(nums) or remove(list(reversed(nums))):
             gold += 1
     return (silver, gold)
-data = """
+input2 = """
 7 6 4 2 1
 1 2 7 8 9
 9 7 6 2 1
@@ -89,8 +72,10 @@ data = """
 8 6 4 4 1
 1 3 6 7 9
 """
-print("Day 2:", end="")
-assert Day2(data) == (2,4), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 2:", end="")
+    assert Day2(input2) == (2,4), "❌"; print(" ⭐ ⭐")
 
 def Day3(data):
     silver = gold = 0
@@ -120,59 +105,31 @@ def Day3(data):
                     gold += x * y
             arguments = ""
     return (silver, gold)
-data = """
+input3 = """
 xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))
 """
-print("Day 3:", end="")
-assert Day3(data) == (161,48), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 3:", end="")
+    assert Day3(input3) == (161,48), "❌"; print(" ⭐ ⭐")
 
 def Day4(data):
-    silver = gold = 0
-    grid = [list(x) for x in data.strip().splitlines()]
-    cols = len(grid[0])
-    rows = len(grid)
-    crosses = set()
-    @cache
-    def find(y, x, i, dy, dx):
-        word = ["X", "M", "A", "S"]
-        ny, nx = y + dy, x + dx
-        if not (0 <= ny < rows and 0 <= nx < cols):
-            return 0
-        if grid[ny][nx] != word[i]:
-            return 0
-        if word[i] == "S":
-            return 1
-        return find(ny, nx, i + 1, dy, dx)
-    for y in range(rows):
-        for x in range(cols):
-            if grid[y][x] == "X":
-                silver += find(y, x, 1, -1, -1) # NW
-                silver += find(y, x, 1, -1,  0) # N
-                silver += find(y, x, 1, -1,  1) # NE
-                silver += find(y, x, 1,  0, -1) # W
-                silver += find(y, x, 1,  1, -1) # SW
-                silver += find(y, x, 1,  1,  0) # S
-                silver += find(y, x, 1,  1,  1) # SE
-                silver += find(y, x, 1,  0,  1) # E
-            elif grid[y][x] == "M":
-                if find(y, x, 2, -1, -1): # NW
-                    if (y-1, x-1) in crosses:
-                        gold += 1
-                    crosses.add((y-1, x-1))
-                if find(y, x, 2, -1,  1): # NE
-                    if (y-1, x+1) in crosses:
-                        gold += 1
-                    crosses.add((y-1, x+1))
-                if find(y, x, 2,  1, -1): # SW
-                    if (y+1, x-1) in crosses:
-                        gold += 1
-                    crosses.add((y+1, x-1))
-                if find(y, x, 2,  1,  1): # SE
-                    if (y+1, x+1) in crosses:
-                        gold += 1
-                    crosses.add((y+1, x+1))
+    from aocgrid import Grid, DIRS8
+    grid = Grid.parse(data)
+    letters = {c: grid.mask(c) for c in "XMAS"}
+    silver = 0
+    for dy, dx in DIRS8:
+        found = letters["X"].copy()
+        for i, c in enumerate("MAS", 1):
+            found &= Grid.shift(letters[c], dy*i, dx*i, False)
+        silver += int(found.sum())
+    # an X-MAS is an A with an M and an S at opposite ends of both diagonals
+    def mas(dy, dx):
+        return (Grid.shift(letters["M"], dy, dx, False) & Grid.shift(letters["S"], -dy, -dx, False)) | \
+               (Grid.shift(letters["S"], dy, dx, False) & Grid.shift(letters["M"], -dy, -dx, False))
+    gold = int((letters["A"] & mas(-1, -1) & mas(-1, 1)).sum())
     return (silver, gold)
-data = """
+input4 = """
 MMMSXXMASM
 MSAMXMSMSA
 AMXSXMAAMM
@@ -184,8 +141,10 @@ SAXAMASAAA
 MAMMMXMMMM
 MXMXAXMASX
 """
-print("Day 4:", end="")
-assert Day4(data) == (18,9), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 4:", end="")
+    assert Day4(input4) == (18,9), "❌"; print(" ⭐ ⭐")
 
 
 def Day5(data):
@@ -223,7 +182,7 @@ def Day5(data):
         else:
             gold += ordered[len(ordered) // 2]
     return (silver, gold)
-data = """
+input5 = """
 47|53
 97|13
 97|61
@@ -252,65 +211,48 @@ data = """
 61,13,29
 97,13,75,29,47
 """
-print("Day 5:", end="")
-assert Day5(data) == (143, 123), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 5:", end="")
+    assert Day5(input5) == (143, 123), "❌"; print(" ⭐ ⭐")
 
 
 def Day6(data):
+    from aocgrid import Grid
     silver = gold = 0
-    data = data.strip()
-    pos = data.replace("\n", "").index("^")
-    cols = data.index("\n")
-    rows = data.count("\n") + 1
-    sy, sx = 0, 0
-    rocks = set()
-    for i in range(len(data.strip())):
-        if data[i] == "#":
-            rocks.add((i // (cols + 1), i % (rows + 1)))
-        elif data[i] == "^":
-            sy, sx = i // (cols + 1), i % (rows + 1)
-    dirs = [(-1,0), (0,1), (1,0), (0,-1)]
-    def inbounds(y,x):
-        return (0 <= y < rows) and (0 <= x < cols)
-    def isrock(y,x):
-        return (y,x) in rocks
-    def walk(y,x,curr):
+    # the border marks the way out, so a step needs no bounds check
+    grid = Grid.parse(data).padded("!")
+    cells = grid.buffer
+    rock, out = ord("#"), ord("!")
+    start = cells.index(ord("^"))
+    dirs = grid.offsets() # N E S W
+    def walk(i, curr):
         positions = set()
-        dirpositions = set()
+        states = set()
         while True:
             # check seen
-            if (curr, y, x) in dirpositions:
+            if i * 4 + curr in states:
                 return False
             # update position
-            positions.add((y,x))
-            dirpositions.add((curr,y,x))
-            # new position
-            ny, nx = y + dirs[curr][0], x + dirs[curr][1]
-            if not inbounds(ny,nx):
-                return positions
-            # wall turn right
-            if isrock(ny,nx):
-                dirpositions.add((curr,y,x))
+            positions.add(i)
+            states.add(i * 4 + curr)
+            # wall turn right, twice in a corner
+            n = i + dirs[curr]
+            while cells[n] == rock:
                 curr = (curr + 1) % 4
-                ny, nx = y + dirs[curr][0], x + dirs[curr][1]
-            # corner check
-            if isrock(ny,nx):
-                dirpositions.add((curr,y,x))
-                curr = (curr + 1) % 4
-                ny, nx = y + dirs[curr][0], x + dirs[curr][1]
-            # update position
-            y, x = ny, nx
-    positions = walk(sy,sx,0)
+                n = i + dirs[curr]
+            if cells[n] == out:
+                return positions
+            i = n
+    positions = walk(start, 0)
     silver = len(positions)
-    for ry, rx in positions:
-        if (ry,rx) in rocks:
-            continue
-        rocks.add((ry,rx))
-        if not walk(sy,sx,0):
+    for i in positions - {start}:
+        cells[i] = rock
+        if not walk(start, 0):
             gold += 1
-        rocks.remove((ry,rx))
+        cells[i] = ord(".")
     return (silver, gold)
-data = """
+input6 = """
 ....#.....
 .........#
 ..........
@@ -322,8 +264,10 @@ data = """
 #.........
 ......#...
 """
-print("Day 6:", end="")
-assert Day6(data) == (41, 6), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 6:", end="")
+    assert Day6(input6) == (41, 6), "❌"; print(" ⭐ ⭐")
 
 
 def Day7(data):
@@ -345,7 +289,7 @@ def Day7(data):
         elif dfs(0, 0, True):
             gold += target
     return (silver, gold)
-data = """
+input7 = """
 190: 10 19
 3267: 81 40 27
 83: 17 5
@@ -356,52 +300,42 @@ data = """
 21037: 9 7 18 13
 292: 11 6 16 20
 """
-print("Day 7:", end="")
-assert Day7(data) == (3749,11387), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 7:", end="")
+    assert Day7(input7) == (3749,11387), "❌"; print(" ⭐ ⭐")
 
 
 def Day8(data):
+    from aocgrid import Grid
+    grid = Grid.parse(data)
+    rows, cols = grid.height, grid.width
     silver, gold = set(), set()
-    data = [list(x) for x in data.strip().splitlines()]
-    cols = len(data[0])
-    rows = len(data)
-    antenna = defaultdict(set)
-    antennas = set()
-    for y in range(rows):
-        for x in range(cols):
-            if data[y][x] == ".":
-                continue
-            antenna[data[y][x]].add((y,x))
-            antennas.add((y,x))
+    antenna = defaultdict(list)
+    for frequency in set(grid.buffer) - {ord(".")}:
+        antenna[frequency] = grid.findall(chr(frequency))
+    antennas = {grid.index(y, x) for nodes in antenna.values() for y, x in nodes}
     def propagate_signal(y, x, dy, dx, powered):
         y, x = y + dy, x + dx
         first = True
         while 0 <= y < rows and 0 <= x < cols:
+            i = y * cols + x
             if first:
-                silver.add((y, x))
+                silver.add(i)
                 first = False
-            if (y, x) not in antennas:
-                gold.add((y, x))
+            if i not in antennas:
+                gold.add(i)
             if not powered:
                 break
             y, x = y + dy, x + dx
-    completed = set()
-    for key, nodes in antenna.items():
-        powered = False
-        if len(nodes) > 1:
-            powered = True
-        for y1,x1 in nodes:
-            for y2,x2 in nodes:
-                if y1 == y2 and x1 == x2:
-                    continue
-                if (y1, x1, y2, x2) in completed:
-                    continue
-                completed.add((y1, x1, y2, x2))
-                completed.add((y2, x2, y1, x1))
+    for nodes in antenna.values():
+        powered = len(nodes) > 1
+        for a, (y1, x1) in enumerate(nodes):
+            for y2, x2 in nodes[a+1:]:
                 propagate_signal(y1, x1, y1-y2, x1-x2, powered)
                 propagate_signal(y2, x2, y2-y1, x2-x1, powered)
     return (len(silver), len(gold) + len(antennas))
-data = """
+input8 = """
 ............
 ........0...
 .....0......
@@ -415,8 +349,10 @@ data = """
 ............
 ............
 """
-print("Day 8:", end="")
-assert Day8(data) == (14,34), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 8:", end="")
+    assert Day8(input8) == (14,34), "❌"; print(" ⭐ ⭐")
 
 def Day9(data):
     counts = list(map(int, list(data.strip())))
@@ -469,37 +405,39 @@ def Day9(data):
         if gold[i] != ".":
             gold_checksum += i * gold[i]
     return (silver_checksum, gold_checksum)
-print("Day 9:", end="")
-data = """
+input9 = """
 2333133121414131402
 """
-assert Day9(data) == (1928, 2858), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 9:", end="")
+    assert Day9(input9) == (1928, 2858), "❌"; print(" ⭐ ⭐")
 
 
 def Day10(data):
-    silver = set(); gold = 0
-    grid = [list(map(int,x)) for x in data.strip().splitlines()]
-    cols, rows = len(grid[0]), len(grid)
-    starts = set()
-    for y in range(rows):
-        for x in range(cols):
-            if grid[y][x] == 0:
-                starts.add((y,x))
-    def dfs(y, x, sy, sx):
-        curr = grid[y][x]
-        if curr == 9:
-            silver.add((sy,sx,y,x))
-            return 1
-        total = 0
-        for dy, dx in [(0,1),(1,0),(0,-1),(-1,0)]:
-            if 0 <= y+dy < rows and 0 <= x+dx < cols \
-            and curr + 1 == grid[y+dy][x+dx]:
-                total += dfs(y+dy, x+dx, sy, sx)
-        return total
-    for y, x in starts:
-        gold += dfs(y, x, y, x)
-    return (len(silver), gold)
-data = """
+    from aocgrid import Grid, DIRS4
+    import numpy as np
+    heights = Grid.parse(data).digits()
+    # walk down from the peaks one height at a time: a cell's rating is the
+    # sum of its uphill neighbours' ratings, and its score is the number of
+    # peaks in the union of their bitsets
+    peaks = heights == 9
+    rating = peaks.astype(object)
+    reach = np.zeros(heights.shape, object)
+    reach[peaks] = [1 << bit for bit in range(int(peaks.sum()))]
+    for level in range(8, -1, -1):
+        here = heights == level
+        next_rating = np.zeros(heights.shape, object)
+        next_reach = np.zeros(heights.shape, object)
+        for dy, dx in DIRS4:
+            uphill = here & (Grid.shift(heights, dy, dx, 255) == level + 1)
+            next_rating[uphill] += Grid.shift(rating, dy, dx)[uphill]
+            next_reach[uphill] |= Grid.shift(reach, dy, dx)[uphill]
+        rating, reach = next_rating, next_reach
+    silver = sum(bits.bit_count() for bits in reach[heights == 0])
+    gold = int(rating[heights == 0].sum())
+    return (silver, gold)
+input10 = """
 89010123
 78121874
 87430965
@@ -509,8 +447,10 @@ data = """
 01329801
 10456732
 """
-print("Day 10:", end="")
-assert Day10(data) == (36, 81), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 10:", end="")
+    assert Day10(input10) == (36, 81), "❌"; print(" ⭐ ⭐")
 
 
 def Day11(data):
@@ -536,96 +476,53 @@ def Day11(data):
         if (i + 1) == 75:
             gold = sum(tab.values())
     return (silver, gold)
-data = """
+input11 = """
 125 17
 """
-print("Day 11:", end="")
-assert Day11(data) == (55312, 65601038650482), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 11:", end="")
+    assert Day11(input11) == (55312, 65601038650482), "❌"; print(" ⭐ ⭐")
 
 
 def Day12(data):
-    silver = 0; gold = 0
-    matrix = [list(x) for x in data.strip().splitlines()]
-    rows, cols = len(matrix), len(matrix[0])
-    areas = defaultdict(set)
-    edges = defaultdict(Counter)
-    seen = set()
-    # record area and edges
-    def flood_fill(y, x, sy, sx, idx):
-        if not (0 <= y < rows and 0 <= x < cols):
-            return
-        if (y, x) in seen:
-            return
-        if matrix[y][x] != matrix[sy][sx]:
-            return
-        seen.add((y, x))
-        areas[idx].add((y, x))
-        flood_fill(y+1, x, sy, sx, idx)
-        flood_fill(y-1, x, sy, sx, idx)
-        flood_fill(y, x+1, sy, sx, idx)
-        flood_fill(y, x-1, sy, sx, idx)
-    idx = 0
-    for y in range(rows):
-        for x in range(cols):
-            if (y, x) in seen:
-                continue
-            flood_fill(y, x, y, x, idx)
-            idx += 1
-    for idx, position in areas.items():
-        for y, x in position:
-            # forward edge
-            edges[idx][((y,x), (y,x+1))] += 1
-            edges[idx][((y,x), (y+1,x))] += 1
-            edges[idx][((y+1,x), (y+1,x+1))] += 1
-            edges[idx][((y,x+1), (y+1,x+1))] += 1
-            # backwards edge
-            edges[idx][((y,x+1), (y,x))] += 1
-            edges[idx][((y+1,x), (y,x))] += 1
-            edges[idx][((y+1,x+1), (y+1,x))] += 1
-            edges[idx][((y+1,x+1), (y,x+1))] += 1
-    # filter non-unique edges
-    for idx in edges.keys():
-        edge_set = set([edge for edge, count in edges[idx].items() if count == 1])
-        edges[idx] = edge_set
-    # count sides by segments
-    def count_sides(edges, idx):
-        sides = 0
-        for edge in edges:
-            y1, x1 = edge[0]
-            y2, x2 = edge[1]
-            # horizontal segments
-            if y1 == y2:
-                if ((y1, x1-1), (y2, x2-1)) in edges: # left most
-                    continue
-                sides += 1
-            # vertical segments
-            if x1 == x2:
-                if ((y1-1, x1), (y2-1, x2)) in edges: # top most
-                    continue
-                sides += 1
-        return sides // 2
-    # calculate perimeter
-    for idx, adj in edges.items():
-        curr = None
-        perimeter = 0
-        sides = count_sides(adj, idx)
-        while adj:
-            if not curr:
-                curr = next(iter(adj))
-            y, x = curr[1] # end of current edge
-            for dy, dx in [(0,1), (1,0), (0,-1), (-1,0)]:
-                next_edge = ((y,x), (y+dy, x+dx))
-                altr_edge = ((y+dy,x+dx), (y, x))
-                if next_edge in adj:
-                    curr = next_edge
-                    adj.remove(next_edge)
-                    adj.remove(altr_edge)
-                    perimeter += 1
-            curr = None
-        silver += perimeter * len(areas[idx])
-        gold += sides * len(areas[idx])
+    from aocgrid import Grid, DIRS4
+    import numpy as np
+    grid = Grid.parse(data).padded("\0")
+    cells = grid.buffer
+    offsets = grid.offsets()
+    # flood fill each region into a label, the border keeps label 0
+    labels = [0] * len(cells)
+    regions = 0
+    for start, plant in enumerate(cells):
+        if not plant or labels[start]:
+            continue
+        regions += 1
+        labels[start] = regions
+        stack = [start]
+        while stack:
+            i = stack.pop()
+            for offset in offsets:
+                if cells[i + offset] == plant and not labels[i + offset]:
+                    labels[i + offset] = regions
+                    stack.append(i + offset)
+    labels = np.array(labels).reshape(grid.height, grid.width)
+    # every fence is a side of a cell facing another region, and a region
+    # has as many straight sides as it has corners
+    same = {(dy, dx): Grid.shift(labels, dy, dx) == labels for dy, dx in DIRS4}
+    fences = sum(~same[d] for d in DIRS4)
+    corners = np.zeros(labels.shape, int)
+    for (ay, ax), (by, bx) in zip(DIRS4, DIRS4[1:] + DIRS4[:1]):
+        diagonal = Grid.shift(labels, ay + by, ax + bx) == labels
+        corners += ~same[(ay, ax)] & ~same[(by, bx)]
+        corners += same[(ay, ax)] & same[(by, bx)] & ~diagonal
+    areas = np.bincount(labels.ravel(), minlength=regions + 1)[1:]
+    perimeters = np.bincount(labels.ravel(), fences.ravel(), regions + 1)[1:]
+    sides = np.bincount(labels.ravel(), corners.ravel(), regions + 1)[1:]
+    silver = int(areas @ perimeters)
+    gold = int(areas @ sides)
     return (silver, gold)
-data = """
+input12 = """
 RRRRIICCFF
 RRRRIICCCF
 VVRRRCCFFF
@@ -637,8 +534,10 @@ MIIIIIJJEE
 MIIISIJEEE
 MMMISSJEEE
 """
-print("Day 12:", end="")
-assert Day12(data) == (1930,1206), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 12:", end="")
+    assert Day12(input12) == (1930,1206), "❌"; print(" ⭐ ⭐")
 
 
 def Day13(data):
@@ -667,6 +566,7 @@ def Day13(data):
 
 
 def Day13(data):
+    import numpy as np
     silver = 0; gold = 0
     data = data.strip().splitlines()
     games = []
@@ -695,7 +595,7 @@ def Day13(data):
         if (gx+offset) == x and (gy+offset) == y:
             gold += 3 * a_presses + b_presses
     return (silver, gold)
-data = """
+input13 = """
 Button A: X+94, Y+34
 Button B: X+22, Y+67
 Prize: X=8400, Y=5400\n
@@ -709,8 +609,10 @@ Button A: X+69, Y+23
 Button B: X+27, Y+71
 Prize: X=18641, Y=10279
 """
-print("Day 13:", end="")
-assert Day13(data) == (480,875318608908), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 13:", end="")
+    assert Day13(input13) == (480,875318608908), "❌"; print(" ⭐ ⭐")
 
 
 def Day14(data):
@@ -743,7 +645,7 @@ def Day14(data):
         elif i > 99 and len(bots) == len(set(bots)):
             gold = i + 1; break
     return (silver, gold)
-data = """
+input14 = """
 p=0,4 v=3,-3
 p=6,3 v=-1,-3
 p=10,3 v=-1,2
@@ -757,57 +659,39 @@ p=7,3 v=-1,2
 p=2,4 v=2,-3
 p=9,5 v=-3,-3
 """
-print("Day 14:", end="")
-assert Day14(data) == (12, 105), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 14:", end="")
+    assert Day14(input14) == (12, 105), "❌"; print(" ⭐ ⭐")
 
 
 def Day15(data):
+    from aocgrid import Grid
+    import numpy as np
     silver = 0; gold = 0
-    dirs = { '<': (0, -1), '>': (0, 1), '^': (-1, 0), 'v': (1, 0) }
-    matrix = []
-    moves = []
-    for line in data.strip().splitlines():
-        if line == "\n":
+    lines = data.strip().splitlines()
+    grid = Grid.parse("\n".join(line for line in lines if line.startswith("#")))
+    moves = "".join(line for line in lines if line and not line.startswith("#"))
+    cells = grid.buffer
+    wall, box, empty = ord("#"), ord("O"), ord(".")
+    dirs = { '<': -1, '>': 1, '^': -grid.width, 'v': grid.width }
+    robot = cells.index(ord("@"))
+    cells[robot] = empty
+    for move in moves:
+        step = dirs[move]
+        # a push moves the whole row of boxes, which is the same as
+        # moving the first box to the end of the row
+        end = robot + step
+        while cells[end] == box:
+            end += step
+        if cells[end] == wall:
             continue
-        elif line.startswith("#"):
-            matrix.append(list(line))
-        else:
-            moves.extend(dirs[x] for x in line)
-    cols = len(matrix[0])
-    rows = len(matrix)
-    walls = set()
-    boxes = set()
-    robot = tuple()
-    for y in range(rows):
-        for x in range(cols):
-            if matrix[y][x] == "#":
-                walls.add((y,x))
-            elif matrix[y][x] == "O":
-                boxes.add((y,x))
-            elif matrix[y][x] == "@":
-                robot = (y,x)
-    def try_move(y, x, dy, dx):
-        if (y+dy, x+dx) in walls:
-            return False
-        if (y+dy, x+dx) in boxes:
-            return try_move(y+dy, x+dx, dy, dx)
-        return True
-    def push(y, x, dy, dx):
-        if (y,x) in walls:
-            return
-        if (y,x) in boxes:
-            push(y+dy, x+dx, dy, dx)
-            boxes.remove((y,x))
-            boxes.add((y+dy, x+dx))
-    for dy, dx in moves:
-        y, x = robot
-        if try_move(y, x, dy, dx):
-            robot = (y+dy, x+dx)
-            push(y+dy, x+dx, dy, dx)
-    for y, x in boxes:
-        silver += (100 * y) + x
+        robot += step
+        cells[end], cells[robot] = cells[robot], empty
+    ys, xs = np.nonzero(grid.cells == box)
+    silver = int((100 * ys + xs).sum())
     return (silver, gold)
-data = """
+input15 = """
 ########
 #..O.O.#
 ##@.O..#
@@ -818,45 +702,33 @@ data = """
 ########\n
 <^^>>>vv<v>>v<<
 """
-print("Day 15:", end="")
-assert Day15(data) == (2028, 0), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 15:", end="")
+    assert Day15(input15) == (2028, 0), "❌"; print(" ⭐ ⭐")
 
 def Day16(data):
-    silver = inf; gold = set()
-    matrix = [list(x) for x in data.strip().splitlines()]
-    walls = set()
-    start, goal = tuple(), tuple()
-    curr = tuple()
-    for y in range(len(matrix)):
-        for x in range(len(matrix[0])):
-            if matrix[y][x] == "#":
-                walls.add((y,x))
-            elif matrix[y][x] == "S":
-                start = (y,x)
-            elif matrix[y][x] == "E":
-                goal = (y,x)
-    visited = set()
-    scores = {}
-    minheap = [(1, (0,1), start, [start, goal])]
-    while minheap:
-        score, (py,px), (y, x), path = heappop(minheap)
-        for dy, dx in ((0,1), (1,0), (0,-1), (-1,0)):
-            ny, nx = y + dy, x + dx
-            if (ny, nx) == goal and score <= silver:
-                silver = score
-                gold = gold | set(path)
-                continue
-            if (ny, nx) in walls:
-                continue
-            if (ny, nx) in visited and score > 1000 + scores[(ny, nx)]:
-                continue
-            visited.add((ny, nx))
-            scores[(ny, nx)] = min(scores.get((ny, nx), math.inf), score)
-            curpath = path + [(ny, nx)]
-            cost = 1 if (dy,dx) == (py, px) else 1001
-            heappush(minheap, (score + cost, (dy, dx), (ny, nx), curpath))
-    return (silver, len(gold))
-data = """
+    from aocgrid import Grid, shortest_paths
+    import numpy as np
+    grid = Grid.parse(data)
+    cells, offsets = grid.buffer, grid.offsets()
+    start, goal = cells.find(b"S"), cells.find(b"E")
+    # a state is cell * 4 + facing (N E S W), a step costs 1 and a turn 1000
+    def moves(state):
+        cell, facing = divmod(state, 4)
+        return (state + 4 * offsets[facing], cell * 4 + (facing + 1) % 4, cell * 4 + (facing + 3) % 4)
+    allowed = lambda state, step: cells[step >> 2] != ord("#")
+    weight = lambda state, step: 1 if state & 3 == step & 3 else 1000
+    ahead, _ = shortest_paths(4 * len(cells), [4 * start + 1], moves, allowed, weight, (1, 1000))
+    # leaving E facing backwards retraces a path, so a tile is on a best
+    # path when the costs from S and from E add up to the best score
+    behind, _ = shortest_paths(4 * len(cells), range(4 * goal, 4 * goal + 4), moves, allowed, weight, (1, 1000))
+    ahead = np.frombuffer(ahead, np.int64).reshape(-1, 4)
+    behind = np.roll(np.frombuffer(behind, np.int64).reshape(-1, 4), 2, axis=1)
+    silver = int(ahead[goal][ahead[goal] >= 0].min())
+    best = (ahead >= 0) & (behind >= 0) & (ahead + behind == silver)
+    return (silver, int(best.any(axis=1).sum()))
+input16 = """
 ###############
 #.......#....E#
 #.#.###.#.###.#
@@ -873,8 +745,10 @@ data = """
 #S..#.....#...#
 ###############
 """
-print("Day 16:", end="")
-assert Day16(data) == (7036, 45), "❌"; print(" ⭐")
+
+if __name__ == "__main__":
+    print("Day 16:", end="")
+    assert Day16(input16) == (7036, 45), "❌"; print(" ⭐")
 
 
 def Day17(data):
@@ -940,55 +814,59 @@ def Day17(data):
         if DEBUG: print(reg)
         if DEBUG: input()
     return (",".join(output))
-data = """
+input17 = """
 Register A: 729
 Register B: 0
 Register C: 0\n
 Program: 0,1,5,4,3,0
 """
-print("Day 17:", end="")
-assert Day17(data) == ("4,6,3,5,6,3,5,2,1,0"), "❌"; print(" ⭐")
 
+if __name__ == "__main__":
+    print("Day 17:", end="")
+    assert Day17(input17) == ("4,6,3,5,6,3,5,2,1,0"), "❌"; print(" ⭐")
 
-def Day18(data):
+
+def Day18(data, size=None, fallen=None):
+    from aocgrid import UNREACHED, shortest_paths
     silver = 0; gold = 0
-    lines = [line.split(",") for line in data.strip().splitlines()]
-    allwalls = [(int(y),int(x)) for x,y in lines]
-    start, goal = (0,0), (6,6)
-    cols, rows = 7, 7
-    def manhattan(a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-    for i in range(len(allwalls)):
-        walls = set(allwalls[:i])
-        heap = [(manhattan(start, goal), 0, start)]
-        visited = set()
-        while heap:
-            score, steps, (y, x) = heappop(heap)
-            if (y, x) == goal:
-                if i == 12:
-                    silver = steps
-                break
-            for dy, dx in ((1,0), (0,1), (-1,0), (0,-1)):
-                ny, nx = y + dy, x + dx
-                if (ny, nx) in visited:
-                    continue
-                if not (0 <= ny < rows and 0 <= nx < cols):
-                    continue
-                if (ny, nx) in walls:
-                    continue
-                visited.add((ny, nx))
-                heappush(heap, (manhattan((ny, nx), goal), steps + 1, (ny, nx)))
-        if not heap:
-            gold = ",".join(map(str,allwalls[i-1]))
-            return (silver, gold)
-data = """
+    lines = data.split()
+    coords = [tuple(map(int, line.split(","))) for line in lines]
+    # the example is a 7x7 space after 12 bytes, real inputs 71x71 after
+    # 1024, and smaller generated spaces get the same share of bytes
+    size = size or max(map(max, coords)) + 1
+    fallen = fallen or (12 if size == 7 else size * size * 1024 // (71 * 71))
+    # each cell keeps the time its byte lands, the border has always landed
+    width = size + 2
+    landed = [len(coords)] * (width * width)
+    for i in range(width):
+        landed[i] = landed[-1 - i] = landed[i * width] = landed[i * width + width - 1] = -1
+    for time, (x, y) in reversed(list(enumerate(coords))):
+        landed[(y + 1) * width + x + 1] = time
+    start, goal = width + 1, size * width + size
+    def steps(time):
+        distance, _ = shortest_paths(width * width, [start], (-width, 1, width, -1),
+                                     lambda node, step: landed[step] >= time, targets=[goal])
+        return distance[goal]
+    silver = steps(fallen)
+    # the first byte that cuts the path off, bisected over the byte count
+    low, high = 0, len(coords)
+    if steps(high) == UNREACHED:
+        while low < high:
+            middle = (low + high) // 2
+            if steps(middle) == UNREACHED: high = middle
+            else: low = middle + 1
+        gold = lines[low - 1]
+    return (silver, gold)
+input18 = """
 5,4\n4,2\n4,5\n3,0\n2,1\n6,3\n2,4
 1,5\n0,6\n3,3\n2,6\n5,1\n1,2\n5,5
 2,5\n6,5\n1,4\n0,4\n6,4\n1,1\n6,1
 1,0\n0,5\n1,6\n2,0
 """
-print("Day 18:", end="")
-assert Day18(data) == (22, '1,6'), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 18:", end="")
+    assert Day18(input18) == (22, "6,1"), "❌"; print(" ⭐ ⭐")
 
 
 def Day19(data):
@@ -1012,7 +890,7 @@ def Day19(data):
             silver += 1
         gold += combinations
     return (silver, gold)
-data = """
+input19 = """
 r, wr, b, g, bwu, rb, gb, br\n
 brwrr
 bggr
@@ -1023,8 +901,10 @@ bwurrg
 brgr
 bbrgwb
 """
-print("Day 19:", end="")
-assert Day19(data) == (6, 16), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 19:", end="")
+    assert Day19(input19) == (6, 16), "❌"; print(" ⭐ ⭐")
 
 
 def Day22(data):
@@ -1036,7 +916,7 @@ def Day22(data):
     def prune(secret):
         return secret % 16777216
     for secret in data:
-        change = [num % 10]
+        change = [secret % 10]
         prices = [0]
         seen = set()
         for _ in range(2000):
@@ -1054,14 +934,16 @@ def Day22(data):
         silver += secret
     gold = max(freq.values())
     return silver, gold
-data = """
+input22 = """
 1
 2
 3
 2024
 """
-print("Day 22:", end="")
-assert Day22(data) == (37990510, 23), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 22:", end="")
+    assert Day22(input22) == (37990510, 23), "❌"; print(" ⭐ ⭐")
 
 
 def Day23(data):
@@ -1095,7 +977,7 @@ def Day23(data):
                         break
     gold = ",".join(sorted(next(iter(connected))))
     return silver, gold
-data = """
+input23 = """
 kh-tc\nqp-kh\nde-cg\nka-co\nyn-aq
 qp-ub\ncg-tb\nvc-aq\ntb-ka\nwh-tc
 yn-cg\nkh-ub\nta-co\nde-co\ntc-td
@@ -1104,5 +986,7 @@ wq-ub\nub-vc\nde-ta\nwq-aq\nwq-vc
 wh-yn\nka-de\nkh-ta\nco-tc\nwh-qp
 tb-vc\ntd-yn
 """
-print("Day 23:", end="")
-assert Day23(data) == (7, 'co,de,ka,ta'), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 23:", end="")
+    assert Day23(input23) == (7, 'co,de,ka,ta'), "❌"; print(" ⭐ ⭐")
@@ -1,21 +1,14 @@
 #!/usr/bin/env python3
 
 import re
-import numpy as np
 from collections import Counter, defaultdict
 from functools import cache, reduce
 from itertools import combinations
 from heapq import heappush, heappop
 from math import prod, inf, dist
 from operator import mul
-from shapely.geometry import Polygon, box
-from z3 import *
 
-print()
-print("##########################")
-print("### ⭐🎄 AOC 2025 🎄⭐ ###")
-print("##########################")
-print()
+SESSION = "" # read by ./aoc.py run when AOC_SESSION is unset
 
 # https://adventofcode.com/2025/day/1
 def Day1(data):
@@ -31,9 +24,16 @@ def Day1(data):
         if curr == 0:
             silver += 1
     return (silver, gold)
-data = """L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n"""
-print("Day 1:", end="")
-assert Day1(data) == (3, 6), "❌"; print(" ⭐ ⭐")
+input1 = """L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n"""
+
+if __name__ == "__main__":
+    print()
+    print("##########################")
+    print("### ⭐🎄 AOC 2025 🎄⭐ ###")
+    print("##########################")
+    print()
+    print("Day 1:", end="")
+    assert Day1(input1) == (3, 6), "❌"; print(" ⭐ ⭐")
 
 
 # https://adventofcode.com/2025/day/2
@@ -59,13 +59,15 @@ def Day2(data):
             if prefix[-1] > 0 and n % patlen == 0:
                 gold += int(num)
     return (silver, gold)
-data = """
+input2 = """
 11-22,95-115,998-1012,1188511880-1188511890,222220-222224,
 1698522-1698528,446443-446449,38593856-38593862,565653-565659,
 824824821-824824827,2121212118-2121212124
 """
-print("Day 2:", end="")
-assert Day2(data) == (1227775554, 4174379265), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 2:", end="")
+    assert Day2(input2) == (1227775554, 4174379265), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/3
 def Day3(data):
@@ -91,49 +93,51 @@ def Day3(data):
             _ = stack.pop()
         gold += int("".join(map(str,stack)))
     return (silver, gold)
-data = """
+input3 = """
 987654321111111
 811111111111119
 234234234234278
 818181911112111"""
-print("Day 3:", end="")
-assert Day3(data) == (357, 3121910778619), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 3:", end="")
+    assert Day3(input3) == (357, 3121910778619), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/4
-def Day4(data):
-    silver = gold = prev_gold = 0
-    grid = [[1 if x == "@" else 0 for x in row] for row in data.strip().splitlines()]
-    w = len(grid[0])
-    h = len(grid)
-    def point(x,y):
-        if not (0 <= x < w and 0 <= y < h):
-            return 0
-        return grid[y][x]
-    def neighbors(x,y):
-        return \
-            point(x-1,y-1) + \
-            point(x,y-1) + \
-            point(x+1,y-1) + \
-            point(x-1,y) + \
-            point(x+1,y) + \
-            point(x+1,y+1) + \
-            point(x,y+1) + \
-            point(x-1,y+1)
-    next_grid = [row[:] for row in grid]
-    while True:
-        for y in range(h):
-            for x in range(w):
-                if grid[y][x] and neighbors(x,y) < 4:
-                    next_grid[y][x] = 0
-                    gold += 1
-        if silver == 0:
-            silver = gold
-        if prev_gold == gold:
-            break
-        prev_gold = gold
-        grid = next_grid
+def Day4(data, batch=1 << 16):
+    from aocgrid import Grid
+    import numpy as np
+    # the first round is one vectorized count over the whole grid, after
+    # that removed rolls go through a worklist: each removal decrements its
+    # neighbours and queues the ones that drop below four, every roll is
+    # queued at most once and the work is done in batches so the
+    # temporaries stay small however many rolls fall in one round
+    grid = Grid.parse(data).padded(".")
+    rolls = grid.mask("@")
+    counts = Grid.neighbors(rolls).ravel()
+    rolls = rolls.ravel()
+    first = np.flatnonzero(rolls & (counts < 4))
+    silver = len(first)
+    queue = np.empty(int(rolls.sum()), np.int32 if len(rolls) < 2**31 else np.int64)
+    queue[:silver] = first
+    rolls[first] = False
+    head, tail = 0, silver
+    offsets = grid.offsets(diagonal=True)
+    while head < tail:
+        removed = queue[head:min(head + batch, tail)]
+        head += len(removed)
+        # one offset at a time the indices are unique, so a plain fancy
+        # index decrement is exact
+        for offset in offsets:
+            neighbours = removed + offset
+            counts[neighbours] -= 1
+            falling = neighbours[rolls[neighbours] & (counts[neighbours] < 4)]
+            rolls[falling] = False
+            queue[tail:tail + len(falling)] = falling
+            tail += len(falling)
+    gold = tail
     return (silver, gold)
-data = """
+input4 = """
 ..@@.@@@@.
 @@@.@.@.@@
 @@@@@.@.@@
@@ -145,8 +149,10 @@ data = """
 .@@@@@@@@.
 @.@.@@@.@.
 """
-print("Day 4:", end="")
-assert Day4(data) == (13, 43), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 4:", end="")
+    assert Day4(input4) == (13, 43), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/5
 def Day5(data):
@@ -169,19 +175,21 @@ def Day5(data):
         if stack > 0:
             last_pos = pos
     return (silver, gold)
-data = """
+input5 = """
 3-5\n10-14\n16-20\n12-18\n1\n5\n8\n11\n17\n32
 """
-print("Day 5:", end="")
-Day5(data)
-assert Day5(data) == (3, 14), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 5:", end="")
+    assert Day5(input5) == (3, 14), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/6
 def Day6(data):
+    import numpy as np
     silver = gold = 0
     grid = [[int(x.strip()) for x in row.split(" ") if x] for row in data.strip().splitlines()[:-2]]
     ops = [x for x in data.strip().splitlines()[-1] if x != " "][::-1]
-    totals = [sum(row) if ops[i] == "+" else math.prod(row) for i,row in enumerate(np.rot90(grid))]
+    totals = [sum(row) if ops[i] == "+" else prod(row) for i,row in enumerate(np.rot90(grid))]
     silver = sum(totals)
     grid = [[x for x in row] for row in data.strip().splitlines()[:-1]][:-1]
     rotated_grid, curr = [], []
@@ -198,59 +206,44 @@ def Day6(data):
         if ops[o] == "+":
             gold += sum(row)
         else:
-            gold += math.prod(row)
+            gold += prod(row)
         o += 1
     return (silver, gold)
-data = """
+input6 = """
 123 328  51 64 
  45 64  387 23 
   6 98  215 314
 *   +   *   +  
 """
-print("Day 6:", end="")
-# assert Day6(data) == (4277556, 3263827), "❌"; print(" ⭐ ⭐")
-assert Day6(data) == (25751, 3971), "❌"; print(" ⭐ ⭐") # ???
+
+if __name__ == "__main__":
+    print("Day 6:", end="")
+    # assert Day6(input6) == (4277556, 3263827), "❌"; print(" ⭐ ⭐")
+    assert Day6(input6) == (25751, 3971), "❌"; print(" ⭐ ⭐") # ???
 
 # https://adventofcode.com/2025/day/7
 def Day7(data):
+    from aocgrid import Grid
+    import numpy as np
     silver = gold = 0
-    grid = [[x for x in row] for row in data.strip().splitlines()]
-    h = len(grid); w = len(grid[0])
-    start = ()
-    splitters = set()
-    for y in range(h):
-        for x in range(w):
-            if grid[y][x] == "S":
-                start = (y,x)
-            elif grid[y][x] == "^":
-                splitters.add((y,x))
-    beam = set([start])
-    while True:
-        next_beam = set()
-        for y,x in beam:
-            if (y+1, x) in splitters:
-                silver+= 1
-                next_beam.add((y+1, x-1))
-                next_beam.add((y+1, x+1))
-            else:
-                next_beam.add((y+1, x))
-        if y == h:
-            break
-        beam = next_beam
-    @cache
-    def dfs(y,x):
-        if y == h:
-            return 1
-        res = 0
-        if (y+1, x) in splitters:
-            res += dfs(y+1, x-1)
-            res += dfs(y+1, x+1)
-        else:
-            res += dfs(y+1, x)
-        return res
-    gold = dfs(*start)
+    # the padding catches beams split off the edge of the manifold
+    grid = Grid.parse(data).padded(".")
+    sy, sx = grid.find("S")
+    splitters = grid.mask("^")
+    # count timelines per column one row at a time, python ints as they
+    # double at every splitter
+    timelines = np.zeros(grid.width, object)
+    timelines[sx] = 1
+    for row in splitters[sy+1:]:
+        hit = row & (timelines > 0)
+        silver += int(hit.sum())
+        split = np.where(hit, timelines, 0)
+        timelines = np.where(hit, 0, timelines)
+        timelines[:-1] += split[1:]
+        timelines[1:] += split[:-1]
+    gold = int(timelines.sum())
     return (silver, gold)
-data = """
+input7 = """
 .......S.......
 ...............
 .......^.......
@@ -267,8 +260,10 @@ data = """
 ...............
 .^.^.^.^.^...^.
 ..............."""
-print("Day 7:", end="")
-assert Day7(data) == (21, 40), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 7:", end="")
+    assert Day7(input7) == (21, 40), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/8
 def Day8(data):
@@ -309,7 +304,7 @@ def Day8(data):
             gold = p1[0] * p2[0]
             break
     return (silver, gold)
-data = """
+input8 = """
 162,817,812
 57,618,57
 906,360,560
@@ -331,11 +326,14 @@ data = """
 984,92,344
 425,690,689
 """
-print("Day 8:", end="")
-assert Day8(data) == (40, 25272), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 8:", end="")
+    assert Day8(input8) == (40, 25272), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/9
 def Day9(data):
+    from shapely.geometry import Polygon, box
     silver = gold = 0
     points = [[int(x) for x in row.split(",")] for row in data.strip().splitlines()]
     polygon = Polygon(points)
@@ -355,7 +353,7 @@ def Day9(data):
         silver = max(silver, area(p1,p2))
         gold = max(gold, is_contained(p1,p2))
     return (silver, gold)
-data = """
+input9 = """
 7,1
 11,1
 11,7
@@ -365,11 +363,14 @@ data = """
 2,3
 7,3
 """
-print("Day 9:", end="")
-assert Day9(data) == (50, 24), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 9:", end="")
+    assert Day9(input9) == (50, 24), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/10
 def Day10(data):
+    from z3 import Int, Optimize, Sum
     silver = gold = 0
     lines = data.strip().splitlines()
     targets = [tuple(1 if c == "#" else 0 for c in line if c in ".#") for line in lines]
@@ -407,13 +408,15 @@ def Day10(data):
         m = opt.model()
         gold += sum(m[x].as_long() for x in xs)
     return (silver, gold)
-data = """
+input10 = """
 [.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
 [...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}
 [.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}
 """
-print("Day 10:", end="")
-assert Day10(data) == (7, 33), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 10:", end="")
+    assert Day10(input10) == (7, 33), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/11
 def Day11(data):
@@ -439,7 +442,7 @@ def Day11(data):
     silver = dfs("you", True, True)
     gold = dfs("you", False, False)
     return (silver, gold)
-data = """
+input11 = """
 aaa: you hhh
 you: bbb dac
 bbb: fft eee
@@ -451,8 +454,10 @@ ggg: out
 hhh: dac fff iii
 iii: out
 """
-print("Day 11:", end="")
-assert Day11(data) == (5, 1), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 11:", end="")
+    assert Day11(input11) == (5, 1), "❌"; print(" ⭐ ⭐")
 
 # https://adventofcode.com/2025/day/12
 def Day12(data):
@@ -469,7 +474,7 @@ def Day12(data):
         if (w*h) > total:
             gold += 1
     return (gold, gold)
-data = """
+input12 = """
 0:
 ###
 ##.
@@ -498,5 +503,7 @@ data = """
 12x5: 1 0 1 0 2 2
 12x5: 1 0 1 0 3 2
 """
-print("Day 12:", end="")
-assert Day12(data) == (3, 3), "❌"; print(" ⭐ ⭐")
+
+if __name__ == "__main__":
+    print("Day 12:", end="")
+    assert Day12(input12) == (3, 3), "❌"; print(" ⭐ ⭐")
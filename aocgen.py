@@ -0,0 +1,654 @@
+#!/usr/bin/env python3
+# ./aoc.py gen 2024 9 --scale 10 && python3 -m mypy aocgen.py --strict
+
+#####################################
+### ⭐🎄 Advent of Code Inputs 🎄⭐ ###
+#####################################
+
+# deterministic puzzle input generators, one per registered day (except
+# where a solver only handles the example, noted in its year below)
+#
+# generate(year, day, scale, seed) returns text in the same format as the
+# real input. scale=1 is roughly the size of a real input and the work
+# grows linearly with it: line based days repeat lines, grid days grow
+# each side by sqrt(scale) so the cell count scales.
+
+### types
+
+from typing import Callable, Dict, List, Tuple
+
+### utility
+
+from math import sqrt
+from random import Random
+from string import ascii_lowercase, ascii_letters
+
+Generator = Callable[[Random, float], str]
+
+GENERATORS:Dict[Tuple[int,int],Generator] = {}
+
+def generator(year:int, day:int) -> Callable[[Generator], Generator]:
+    def register(function:Generator) -> Generator:
+        GENERATORS[(year, day)] = function
+        return function
+    return register
+
+def generate(year:int, day:int, scale:float=1, seed:int=0) -> str:
+    try:
+        function:Generator = GENERATORS[(year, day)]
+    except KeyError:
+        raise LookupError(f"no generator for {year} day {day}") from None
+    return function(Random(f"{year}/{day}/{seed}"), scale)
+
+def count(base:int, scale:float) -> int:
+    return max(1, round(base * scale))
+
+def side(base:int, scale:float) -> int:
+    return max(4, round(base * sqrt(scale)))
+
+def lines(rows:List[str]) -> str:
+    return "\n".join(rows) + "\n"
+
+def grid(rng:Random, height:int, width:int, weights:Dict[str,float]) -> List[List[str]]:
+    cells:List[str] = list(weights)
+    return [rng.choices(cells, list(weights.values()), k=width) for _ in range(height)]
+
+def place(rng:Random, rows:List[List[str]], char:str, border:int=0) -> Tuple[int,int]:
+    y:int = rng.randrange(border, len(rows) - border)
+    x:int = rng.randrange(border, len(rows[0]) - border)
+    rows[y][x] = char
+    return y, x
+
+def render(rows:List[List[str]]) -> str:
+    return lines(["".join(row) for row in rows])
+
+def names(rng:Random, total:int, length:int) -> List[str]:
+    # grow the names when the requested length cannot fit them all
+    while 26 ** length < total * 2:
+        length += 1
+    found:Dict[str,None] = {}
+    while len(found) < total:
+        found["".join(rng.choices(ascii_lowercase, k=length))] = None
+    return list(found)
+
+#####################################
+### 2022
+#####################################
+
+@generator(2022, 1)
+def calories(rng:Random, scale:float) -> str:
+    groups:List[str] = ["\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+                        for _ in range(count(250, scale))]
+    return "\n\n".join(groups) + "\n"
+
+@generator(2022, 2)
+def strategy_guide(rng:Random, scale:float) -> str:
+    return lines([f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(count(2500, scale))])
+
+@generator(2022, 3)
+def rucksacks(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    for _ in range(count(100, scale)):
+        # each elf of a group draws from its own third of the other letters,
+        # so the badge is the only item all three carry and the shared item
+        # the only one in both compartments
+        badge:str = rng.choice(ascii_letters)
+        pool:List[str] = rng.sample(ascii_letters.replace(badge, ""), 51)
+        for elf in range(3):
+            shared, *items = pool[elf*17:elf*17 + 17]
+            half:int = rng.randint(4, 24)
+            left:List[str] = rng.choices(items[:8], k=half - 1) + [shared]
+            right:List[str] = rng.choices(items[8:], k=half - 2) + [shared, badge]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            rows.append("".join(left + right))
+    return lines(rows)
+
+@generator(2022, 4)
+def section_pairs(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    for _ in range(count(1000, scale)):
+        s1, s2 = rng.randint(1, 99), rng.randint(1, 99)
+        rows.append(f"{s1}-{rng.randint(s1, 99)},{s2}-{rng.randint(s2, 99)}")
+    return lines(rows)
+
+@generator(2022, 5)
+def crate_stacks(rng:Random, scale:float) -> str:
+    stacks:List[List[str]] = [rng.choices(ascii_letters[26:], k=rng.randint(1, count(8, scale)))
+                              for _ in range(9)]
+    height:int = max(map(len, stacks))
+    rows:List[str] = []
+    for level in range(height - 1, -1, -1):
+        rows.append(" ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks))
+    rows.append(" ".join(f" {i} " for i in range(1, 10)))
+    rows.append("")
+    # keep a crate on every stack so each one has a top to read
+    sizes:List[int] = [len(stack) for stack in stacks]
+    for _ in range(count(500, scale)):
+        source:int = rng.choice([i for i, size in enumerate(sizes) if size > 1] or [0])
+        dest:int = rng.choice([i for i in range(9) if i != source])
+        moved:int = rng.randint(1, max(1, sizes[source] - 1)) if sizes[source] > 1 else 0
+        if not moved:
+            continue
+        sizes[source] -= moved
+        sizes[dest] += moved
+        rows.append(f"move {moved} from {source + 1} to {dest + 1}")
+    return lines(rows)
+
+@generator(2022, 6)
+def datastream(rng:Random, scale:float) -> str:
+    # twelve letters can never hold a start-of-message marker, so the
+    # scan has to read the whole stream to reach the one at the end
+    noise:str = "".join(rng.choices(ascii_lowercase[:12], k=count(4096, scale)))
+    return noise + ascii_lowercase[12:] + "\n"
+
+@generator(2022, 7)
+def terminal(rng:Random, scale:float) -> str:
+    # build the tree first: "$ cd /" only works once, so the whole
+    # transcript has to be a single walk from the root
+    total:int = count(200, scale)
+    folders:List[str] = ["/"] + names(rng, total, 4)
+    depth:List[int] = [0]
+    children:List[List[int]] = [[] for _ in folders]
+    for i in range(1, len(folders)):
+        parent:int = rng.randrange(i)
+        while depth[parent] >= 12:
+            parent = rng.randrange(i)
+        children[parent].append(i)
+        depth.append(depth[parent] + 1)
+    # about 45M used like a real disk, so part 2 always has to free space
+    largest:int = 2 * 45_000_000 // (len(folders) * 4)
+    rows:List[str] = ["$ cd /"]
+    def walk(folder:int) -> None:
+        rows.append("$ ls")
+        rows.extend(f"dir {folders[child]}" for child in children[folder])
+        for _ in range(rng.randint(1, 7)):
+            rows.append(f"{rng.randint(1, largest)} {rng.choice(ascii_lowercase)}.txt")
+        for child in children[folder]:
+            rows.append(f"$ cd {folders[child]}")
+            walk(child)
+            rows.append("$ cd ..")
+    walk(0)
+    return lines(rows)
+
+@generator(2022, 8)
+def forest(rng:Random, scale:float) -> str:
+    n:int = side(99, scale)
+    return lines(["".join(rng.choices("0123456789", k=n)) for _ in range(n)])
+
+@generator(2022, 9)
+def rope_moves(rng:Random, scale:float) -> str:
+    return lines([f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(count(2000, scale))])
+
+@generator(2022, 10)
+def crt_program(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    cycles:int = 0
+    x:int = 1
+    total:int = count(240, scale)
+    while cycles < total:
+        if rng.random() < 0.3 or cycles == total - 1:
+            rows.append("noop")
+            cycles += 1
+        else:
+            # keep the sprite roughly on screen
+            step:int = rng.randint(-5, 5) if 0 < x < 39 else (5 if x <= 0 else -5)
+            rows.append(f"addx {step}")
+            x += step
+            cycles += 2
+    return lines(rows)
+
+@generator(2022, 11)
+def monkeys(rng:Random, scale:float) -> str:
+    total:int = 8
+    primes:List[int] = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], total)
+    # like the real inputs only one monkey squares, part 1 never takes a
+    # modulus and repeated squaring would grow the worry without bound
+    square:int = rng.randrange(total)
+    blocks:List[str] = []
+    for i in range(total):
+        items:List[int] = [rng.randint(50, 99) for _ in range(count(4, scale))]
+        op:str = "old * old" if i == square else \
+                 rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"])
+        other:List[int] = [j for j in range(total) if j != i]
+        blocks.append(f"Monkey {i}:\n"
+                      f"  Starting items: {', '.join(map(str, items))}\n"
+                      f"  Operation: new = {op}\n"
+                      f"  Test: divisible by {primes[i]}\n"
+                      f"    If true: throw to monkey {rng.choice(other)}\n"
+                      f"    If false: throw to monkey {rng.choice(other)}")
+    return "\n\n".join(blocks) + "\n"
+
+@generator(2022, 12)
+def heightmap(rng:Random, scale:float) -> str:
+    height, width = side(41, scale), side(160, scale)
+    span:int = height + width - 2
+    # a diagonal ramp climbs at most one letter per step, so E is always
+    # reachable; random dips to 'a' only ever make a step easier
+    rows:List[List[str]] = [[chr(97 + min(25, (x + y) * 26 // span)) for x in range(width)]
+                            for y in range(height)]
+    for _ in range(height * width // 20):
+        y, x = rng.randrange(height), rng.randrange(width)
+        if (height - y) + (width - x) > 4:
+            rows[y][x] = "a"
+    rows[0][0] = "S"
+    rows[height - 1][width - 1] = "E"
+    return render(rows)
+
+@generator(2022, 13)
+def packets(rng:Random, scale:float) -> str:
+    def packet(depth:int) -> str:
+        items:List[str] = [packet(depth + 1) if depth < 4 and rng.random() < 0.3 else str(rng.randint(0, 10))
+                           for _ in range(rng.randint(0, 5))]
+        return f"[{','.join(items)}]"
+    return "\n\n".join(f"{packet(0)}\n{packet(0)}" for _ in range(count(150, scale))) + "\n"
+
+@generator(2022, 14)
+def rock_paths(rng:Random, scale:float) -> str:
+    depth:int = side(170, scale)
+    rows:List[str] = []
+    for _ in range(count(150, scale)):
+        x, y = rng.randint(500 - depth, 500 + depth), rng.randint(2, depth)
+        points:List[str] = [f"{x},{y}"]
+        for i in range(rng.randint(1, 5)):
+            if i % 2:
+                y = max(2, min(depth, y + rng.randint(-6, 6)))
+            else:
+                x = x + rng.randint(-6, 6)
+            points.append(f"{x},{y}")
+        rows.append(" -> ".join(points))
+    return lines(rows)
+
+# no 2022 day 15 generator: the solver is still fixed to the example (row
+# 10 and a 0..20 search box), so a generated input of any size would not
+# hold its one uncovered cell where the solver looks for it
+
+#####################################
+### 2023
+#####################################
+
+WORDS:List[str] = ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+@generator(2023, 1)
+def calibration(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    for _ in range(count(1000, scale)):
+        parts:List[str] = [rng.choice([str(rng.randint(1, 9)), rng.choice(WORDS[1:]),
+                                       "".join(rng.choices(ascii_lowercase, k=3))])
+                           for _ in range(rng.randint(2, 8))]
+        # part 1 needs at least one plain digit on every line
+        parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+        rows.append("".join(parts))
+    return lines(rows)
+
+@generator(2023, 2)
+def cube_games(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    for game in range(1, count(100, scale) + 1):
+        rounds:List[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colors:List[str] = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        rows.append(f"Game {game}: {'; '.join(rounds)}")
+    return lines(rows)
+
+@generator(2023, 3)
+def schematic(rng:Random, scale:float) -> str:
+    n:int = side(140, scale)
+    rows:List[List[str]] = [["."] * n for _ in range(n)]
+    for y in range(n):
+        x:int = rng.randint(0, 3)
+        while x < n - 3:
+            if rng.random() < 0.2:
+                rows[y][x] = rng.choice("*#+$/@=%&-")
+                x += 2
+            else:
+                for i, digit in enumerate(str(rng.randint(1, 999))):
+                    if x + i < n:
+                        rows[y][x + i] = digit
+                x += rng.randint(5, 10)
+    return render(rows)
+
+@generator(2023, 4)
+def scratchcards(rng:Random, scale:float) -> str:
+    total:int = count(200, scale)
+    rows:List[str] = []
+    for card in range(1, total + 1):
+        # never win copies of cards past the end of the table
+        wins:int = min(rng.randint(0, 10), total - card)
+        numbers:List[int] = rng.sample(range(1, 100), 35 - wins)
+        winners:List[int] = numbers[:10]
+        picks:List[int] = winners[:wins] + numbers[10:]
+        rng.shuffle(picks)
+        rows.append(f"Card {card:>3}: {' '.join(f'{x:>2}' for x in winners)} | "
+                    f"{' '.join(f'{x:>2}' for x in picks)}")
+    return lines(rows)
+
+@generator(2023, 6)
+def races(rng:Random, scale:float) -> str:
+    times:List[int] = [rng.randint(40, 99) for _ in range(count(4, scale))]
+    distances:List[int] = [rng.randint(time * time // 8, time * time // 4 - 1) for time in times]
+    return f"Time:      {'  '.join(f'{x:>4}' for x in times)}\n" +\
+           f"Distance:  {'  '.join(f'{x:>4}' for x in distances)}\n"
+
+@generator(2023, 9)
+def sequences(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    for _ in range(count(200, scale)):
+        coefficients:List[int] = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        rows.append(" ".join(str(sum(c * x**i for i, c in enumerate(coefficients))) for x in range(21)))
+    return lines(rows)
+
+#####################################
+### 2024
+#####################################
+
+@generator(2024, 1)
+def location_lists(rng:Random, scale:float) -> str:
+    left:List[int] = [rng.randint(10000, 99999) for _ in range(count(1000, scale))]
+    # reuse left ids on the right so the similarity score is not zero
+    right:List[int] = [rng.choice(left) if rng.random() < 0.5 else rng.randint(10000, 99999) for _ in left]
+    return lines([f"{a}   {b}" for a, b in zip(left, right)])
+
+@generator(2024, 2)
+def reports(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    for _ in range(count(1000, scale)):
+        level:int = rng.randint(1, 90)
+        sign:int = rng.choice([-1, 1])
+        report:List[int] = []
+        for _ in range(rng.randint(5, 8)):
+            report.append(level)
+            level += sign * rng.choice([1, 2, 3, 3, 4, 0])
+        rows.append(" ".join(map(str, report)))
+    return lines(rows)
+
+@generator(2024, 3)
+def corrupted_memory(rng:Random, scale:float) -> str:
+    chunks:List[str] = []
+    for _ in range(count(700, scale)):
+        chunks.append(rng.choice([f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})",
+                                  f"mul({rng.randint(1, 999)} ,{rng.randint(1, 999)})",
+                                  "do()", "don't()", "mul[", "what()", "from()"]))
+        chunks.append("".join(rng.choices("#$%&'()*+,-./:;<=>?@[]^_{|} ", k=rng.randint(0, 6))))
+    # the scanner peeks past a number, so never end on one
+    return "".join(chunks) + "!\n"
+
+@generator(2024, 4)
+def word_search(rng:Random, scale:float) -> str:
+    n:int = side(140, scale)
+    return lines(["".join(rng.choices("XMAS", k=n)) for _ in range(n)])
+
+@generator(2024, 5)
+def page_ordering(rng:Random, scale:float) -> str:
+    pages:List[int] = rng.sample(range(10, 100), 49)
+    rules:List[str] = [f"{a}|{b}" for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates:List[str] = []
+    for _ in range(count(200, scale)):
+        update:List[int] = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + lines(updates)
+
+@generator(2024, 6)
+def guard_lab(rng:Random, scale:float) -> str:
+    n:int = side(130, scale)
+    rows:List[List[str]] = grid(rng, n, n, {".": 0.985, "#": 0.015})
+    place(rng, rows, "^", n // 4)
+    return render(rows)
+
+@generator(2024, 7)
+def calibrations(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    for _ in range(count(850, scale)):
+        numbers:List[int] = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        total:int = numbers[0]
+        for number in numbers[1:]:
+            total = rng.choice([total + number, total * number, int(f"{total}{number}")])
+        if rng.random() < 0.5:
+            total += 1
+        rows.append(f"{total}: {' '.join(map(str, numbers))}")
+    return lines(rows)
+
+@generator(2024, 8)
+def antennas(rng:Random, scale:float) -> str:
+    n:int = side(50, scale)
+    rows:List[List[str]] = [["."] * n for _ in range(n)]
+    frequencies:str = "0123456789" + ascii_letters
+    for _ in range(count(200, scale)):
+        place(rng, rows, rng.choice(frequencies))
+    return render(rows)
+
+@generator(2024, 9)
+def disk_map(rng:Random, scale:float) -> str:
+    digits:List[str] = [str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9))
+                        for i in range(count(10000, scale) * 2 - 1)]
+    return "".join(digits) + "\n"
+
+@generator(2024, 10)
+def topographic_map(rng:Random, scale:float) -> str:
+    n:int = side(45, scale)
+    # heights follow a noisy ramp so hiking trails actually exist
+    return lines(["".join(str(max(0, min(9, (x + y) % 10 + rng.choice([-1, 0, 0, 0, 1]))))
+                          for x in range(n)) for y in range(n)])
+
+@generator(2024, 11)
+def stones(rng:Random, scale:float) -> str:
+    return " ".join(str(rng.randint(0, 999999)) for _ in range(count(8, scale))) + "\n"
+
+@generator(2024, 12)
+def garden_plots(rng:Random, scale:float) -> str:
+    n:int = side(140, scale)
+    block:int = 4
+    plants:List[List[str]] = [rng.choices(ascii_letters[26:], k=n // block + 1) for _ in range(n // block + 1)]
+    return lines(["".join(plants[y // block][x // block] if rng.random() < 0.9 else rng.choice(ascii_letters[26:])
+                          for x in range(n)) for y in range(n)])
+
+@generator(2024, 13)
+def claw_machines(rng:Random, scale:float) -> str:
+    blocks:List[str] = []
+    for _ in range(count(320, scale)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        # keep the button vectors independent for np.linalg.solve
+        while ax * by == ay * bx:
+            by = rng.randint(10, 99)
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        blocks.append(f"Button A: X+{ax}, Y+{ay}\n"
+                      f"Button B: X+{bx}, Y+{by}\n"
+                      f"Prize: X={a * ax + b * bx + rng.choice([0, 0, 1])}, Y={a * ay + b * by}")
+    return "\n\n".join(blocks) + "\n"
+
+@generator(2024, 14)
+def robots(rng:Random, scale:float) -> str:
+    return lines([f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+                  for _ in range(count(500, scale))])
+
+@generator(2024, 15)
+def warehouse(rng:Random, scale:float) -> str:
+    n:int = side(50, scale)
+    rows:List[List[str]] = grid(rng, n, n, {".": 0.5, "O": 0.4, "#": 0.1})
+    for i in range(n):
+        rows[0][i] = rows[n - 1][i] = rows[i][0] = rows[i][n - 1] = "#"
+    place(rng, rows, "@", 1)
+    moves:str = "".join(rng.choices("<>^v", k=count(20000, scale)))
+    return render(rows) + "\n" + lines([moves[i:i + 1000] for i in range(0, len(moves), 1000)])
+
+@generator(2024, 16)
+def reindeer_maze(rng:Random, scale:float) -> str:
+    n:int = side(141, scale)
+    rows:List[List[str]] = grid(rng, n, n, {".": 0.8, "#": 0.2})
+    for i in range(n):
+        rows[0][i] = rows[n - 1][i] = rows[i][0] = rows[i][n - 1] = "#"
+    # clear the bottom row and right column so S always reaches E
+    for i in range(1, n - 1):
+        rows[n - 2][i] = rows[i][n - 2] = "."
+    rows[n - 2][1] = "S"
+    rows[1][n - 2] = "E"
+    return render(rows)
+
+@generator(2024, 17)
+def chronospatial_program(rng:Random, scale:float) -> str:
+    # the usual shape: B = A % 8, mix with constants and C = A >> B,
+    # print B, A >>= 3 and loop until A is zero
+    b1, b2 = rng.randint(1, 7), rng.randint(1, 7)
+    program:List[int] = [2, 4, 1, b1, 7, 5, 1, b2, 4, 0, 0, 3, 5, 5, 3, 0]
+    a:int = rng.randrange(8 ** (count(16, scale) - 1), 8 ** count(16, scale))
+    return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: {','.join(map(str, program))}\n"
+
+@generator(2024, 18)
+def falling_bytes(rng:Random, scale:float) -> str:
+    n:int = side(71, scale)
+    cells:List[Tuple[int,int]] = [(x, y) for y in range(n) for x in range(n) if (x, y) != (0, 0)]
+    return lines([f"{x},{y}" for x, y in rng.sample(cells, len(cells) * 7 // 10)])
+
+@generator(2024, 19)
+def towels(rng:Random, scale:float) -> str:
+    patterns:List[str] = list({"".join(rng.choices("wubrg", k=rng.randint(1, 8))) for _ in range(450)})
+    designs:List[str] = ["".join(rng.choices("wubrg", k=rng.randint(20, 60))) for _ in range(count(400, scale))]
+    return ", ".join(patterns) + "\n\n" + lines(designs)
+
+@generator(2024, 22)
+def secrets(rng:Random, scale:float) -> str:
+    return lines([str(rng.randrange(1, 16777216)) for _ in range(count(2000, scale))])
+
+@generator(2024, 23)
+def lan_party(rng:Random, scale:float) -> str:
+    computers:List[str] = names(rng, count(520, scale), 2)
+    edges:Dict[Tuple[str,str],None] = {}
+    for i, a in enumerate(computers):
+        for b in rng.sample(computers, 6):
+            if a != b:
+                edges[(a, b)] = None
+    # plant one large clique, the real inputs always have one
+    clique:List[str] = rng.sample(computers, 13)
+    for i, a in enumerate(clique):
+        for b in clique[i + 1:]:
+            edges[(a, b)] = None
+    return lines([f"{a}-{b}" for a, b in edges])
+
+#####################################
+### 2025
+#####################################
+
+@generator(2025, 1)
+def rotations(rng:Random, scale:float) -> str:
+    return lines([f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(count(4000, scale))])
+
+@generator(2025, 2)
+def id_ranges(rng:Random, scale:float) -> str:
+    ranges:List[str] = []
+    for _ in range(count(35, scale)):
+        start:int = rng.randint(10, 10 ** rng.randint(3, 10))
+        ranges.append(f"{start}-{start + rng.randint(0, 20000)}")
+    return ",".join(ranges) + "\n"
+
+@generator(2025, 3)
+def battery_banks(rng:Random, scale:float) -> str:
+    return lines(["".join(rng.choices("123456789", k=100)) for _ in range(count(200, scale))])
+
+@generator(2025, 4)
+def paper_rolls(rng:Random, scale:float) -> str:
+    n:int = side(137, scale)
+    return render(grid(rng, n, n, {"@": 0.7, ".": 0.3}))
+
+@generator(2025, 5)
+def fresh_ranges(rng:Random, scale:float) -> str:
+    ranges:List[str] = []
+    for _ in range(count(180, scale)):
+        start:int = rng.randint(1, 10 ** 14)
+        ranges.append(f"{start}-{start + rng.randint(0, 10 ** 12)}")
+    ids:List[str] = [str(rng.randint(1, 10 ** 14)) for _ in range(count(1000, scale))]
+    # Day5 reads ranges and ids without the blank line between them
+    return lines(ranges + ids)
+
+@generator(2025, 6)
+def worksheet(rng:Random, scale:float) -> str:
+    columns:List[List[str]] = []
+    for i in range(count(1000, scale)):
+        numbers:List[str] = [str(rng.randint(1, 9999)) for _ in range(4)]
+        # monotone lengths leave no gaps inside a digit column
+        numbers.sort(key=len, reverse=rng.random() < 0.5)
+        width:int = max(map(len, numbers))
+        # the input is stripped, so the first line must not start with spaces
+        align:Callable[[str], str] = (lambda x: x.ljust(width)) if i == 0 or rng.random() < 0.5 else (lambda x: x.rjust(width))
+        columns.append([align(x) for x in numbers] + [rng.choice("+*").ljust(width)])
+    return lines([" ".join(column[row] for column in columns) for row in range(5)])
+
+@generator(2025, 7)
+def tachyon_manifold(rng:Random, scale:float) -> str:
+    n:int = side(141, scale)
+    rows:List[List[str]] = [["."] * n for _ in range(n)]
+    rows[0][n // 2] = "S"
+    for y in range(2, n, 2):
+        for x in range(1, n - 1):
+            if rng.random() < 0.3:
+                rows[y][x] = "^"
+    return render(rows)
+
+@generator(2025, 8)
+def junction_boxes(rng:Random, scale:float) -> str:
+    return lines([",".join(str(rng.randint(0, 99999)) for _ in range(3)) for _ in range(count(1000, scale))])
+
+@generator(2025, 9)
+def red_tiles(rng:Random, scale:float) -> str:
+    # a rectilinear polygon: a staircase skyline over a flat floor
+    steps:int = count(250, scale)
+    xs:List[int] = sorted(rng.sample(range(1, 100000), steps + 1))
+    heights:List[int] = [rng.randint(1000, 100000) for _ in range(steps)]
+    points:List[Tuple[int,int]] = []
+    for i, h in enumerate(heights):
+        points += [(xs[i], h), (xs[i + 1], h)]
+    # merge the shared corners of equal neighbouring heights
+    points = [p for i, p in enumerate(points) if p != points[i - 1]]
+    points += [(xs[-1], 0), (xs[0], 0)]
+    return lines([f"{x},{y}" for x, y in points])
+
+@generator(2025, 10)
+def machines(rng:Random, scale:float) -> str:
+    rows:List[str] = []
+    for _ in range(count(150, scale)):
+        size:int = rng.randint(4, 10)
+        buttons:List[List[int]] = [sorted(rng.sample(range(size), rng.randint(1, size)))
+                                   for _ in range(rng.randint(3, 10))]
+        lights:List[int] = [0] * size
+        joltage:List[int] = [0] * size
+        for button in buttons:
+            presses:int = rng.randint(0, 20)
+            for i in button:
+                lights[i] ^= presses % 2
+                joltage[i] += presses
+        rows.append(f"[{''.join('.#'[x] for x in lights)}] " +
+                    " ".join(f"({','.join(map(str, b))})" for b in buttons) +
+                    f" {{{','.join(map(str, joltage))}}}")
+    return lines(rows)
+
+@generator(2025, 11)
+def reactor_devices(rng:Random, scale:float) -> str:
+    layers:List[List[str]] = []
+    pool:List[str] = [x for x in names(rng, max(24, count(600, scale)) + 5, 3) if x not in ("you", "out", "dac", "fft")]
+    width:int = 8
+    for i in range(0, len(pool) - width + 1, width):
+        layers.append(pool[i:i + width])
+    layers[0][0] = "you"
+    layers[len(layers) // 3][0] = "dac"
+    layers[2 * len(layers) // 3][0] = "fft"
+    rows:List[str] = []
+    for depth, layer in enumerate(layers):
+        below:List[str] = [x for later in layers[depth + 1:depth + 3] for x in later] or ["out"]
+        for node in layer:
+            rows.append(f"{node}: {' '.join(rng.sample(below, min(len(below), rng.randint(1, 3))))}")
+    return lines(rows)
+
+@generator(2025, 12)
+def present_regions(rng:Random, scale:float) -> str:
+    shapes:List[str] = []
+    for i in range(6):
+        cells:List[str] = rng.choices("#.", weights=[0.7, 0.3], k=9)
+        cells[4] = "#"
+        shapes.append(f"{i}:\n" + "\n".join("".join(cells[r * 3:r * 3 + 3]) for r in range(3)))
+    regions:List[str] = [f"{rng.randint(4, 50)}x{rng.randint(4, 50)}: " +
+                         " ".join(str(rng.randint(0, 60)) for _ in range(6))
+                         for _ in range(count(1000, scale))]
+    return "\n\n".join(shapes) + "\n\n" + lines(regions)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# python3 aocgrid.py && python3 -m mypy aocgrid.py --strict
+
+#####################################
+### ⭐🎄 Advent of Code Grids 🎄⭐ ###
+#####################################
+
+# a Grid is one contiguous bytearray with a (height, width) numpy uint8 view
+# over the same memory, so a solver can loop over flat indices in python
+# (grid.buffer[i]) or work on whole arrays (grid.cells) without converting
+#
+#   flat index   i = y * width + x
+#   neighbours   i + offset for offset in grid.offsets()
+#
+# a padded grid has a one cell border, so flat neighbours never need a
+# bounds check: stepping off the puzzle lands on the border value
+#
+# shortest_paths searches any graph over flat integer ids (grid cells, or
+# cell * 4 + direction states) and keeps its distances in flat arrays
+
+### types
+
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+### utility
+
+import numpy as np
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+
+Cells = Any # np.ndarray
+
+DIRS4:List[Tuple[int,int]] = [(-1,0), (0,1), (1,0), (0,-1)] # N E S W
+DIRS8:List[Tuple[int,int]] = [(-1,-1), (-1,0), (-1,1), (0,1), (1,1), (1,0), (1,-1), (0,-1)]
+
+def _byte(value:Union[str,int]) -> int:
+    return value if isinstance(value, int) else ord(value)
+
+class Grid(object):
+    def __init__(self, buffer:bytearray, height:int, width:int):
+        if len(buffer) != height * width:
+            raise ValueError(f"{len(buffer)} bytes is not a {height}x{width} grid")
+        self.buffer:bytearray = buffer
+        self.height:int = height
+        self.width:int = width
+        self.cells:Cells = np.frombuffer(buffer, np.uint8).reshape(height, width)
+
+    @classmethod
+    def parse(cls, data:str) -> "Grid":
+        raw:bytes = data.strip("\n").encode()
+        width:int = raw.find(b"\n")
+        if width == -1:
+            return cls(bytearray(raw), 1, len(raw))
+        height:int = (len(raw) + 1) // (width + 1)
+        if len(raw) != height * (width + 1) - 1:
+            raise ValueError("grid rows have different lengths")
+        # view the text as rows of width+1 bytes and copy out everything
+        # but the newline column in one go. the copy is deliberate: flat
+        # indices are y * width + x over one contiguous bytearray, which a
+        # view keeping the newlines as stride padding could not give, and
+        # solvers pass str so encoding has already copied once anyway
+        rows:Cells = np.frombuffer(raw, np.uint8, count=height * (width + 1) - 1)
+        rows = np.lib.stride_tricks.as_strided(rows, (height, width), (width + 1, 1))
+        return cls(bytearray(rows.tobytes()), height, width)
+
+    @classmethod
+    def blank(cls, height:int, width:int, fill:Union[str,int]=".") -> "Grid":
+        return cls(bytearray([_byte(fill)]) * (height * width), height, width)
+
+    @classmethod
+    def from_array(cls, cells:Cells) -> "Grid":
+        height, width = cells.shape
+        return cls(bytearray(np.ascontiguousarray(cells, np.uint8).tobytes()), height, width)
+
+    def copy(self) -> "Grid":
+        return Grid(self.buffer[:], self.height, self.width)
+
+    def padded(self, fill:Union[str,int]="#", pad:int=1) -> "Grid":
+        grid = Grid.blank(self.height + 2 * pad, self.width + 2 * pad, fill)
+        grid.cells[pad:-pad, pad:-pad] = self.cells
+        return grid
+
+    ### cells
+
+    def __getitem__(self, key:Any) -> Any:
+        return self.cells[key]
+
+    def __contains__(self, position:Tuple[int,int]) -> bool:
+        y, x = position
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def __str__(self) -> str:
+        return "\n".join(bytes(row).decode() for row in self.cells) + "\n"
+
+    def mask(self, chars:str) -> Cells:
+        if len(chars) == 1:
+            return self.cells == ord(chars)
+        return np.isin(self.cells, list(chars.encode()))
+
+    def digits(self) -> Cells:
+        return self.cells - ord("0")
+
+    def find(self, char:str) -> Tuple[int,int]:
+        i:int = self.buffer.find(_byte(char))
+        if i == -1:
+            raise ValueError(f"{char!r} not in grid")
+        return self.position(i)
+
+    def findall(self, char:str) -> List[Tuple[int,int]]:
+        return [(int(y), int(x)) for y, x in zip(*np.nonzero(self.cells == ord(char)))]
+
+    ### flat indices
+
+    def index(self, y:int, x:int) -> int:
+        return y * self.width + x
+
+    def position(self, i:int) -> Tuple[int,int]:
+        return divmod(i, self.width)
+
+    def offsets(self, diagonal:bool=False) -> List[int]:
+        return [dy * self.width + dx for dy, dx in (DIRS8 if diagonal else DIRS4)]
+
+    ### whole grid operations
+
+    @staticmethod
+    def shift(cells:Cells, dy:int, dx:int, fill:Any=0) -> Cells:
+        # out[y, x] = cells[y + dy, x + dx], fill where that is off the grid
+        out:Cells = np.full_like(cells, fill)
+        height, width = cells.shape
+        out[max(0, -dy):height - max(0, dy), max(0, -dx):width - max(0, dx)] = \
+            cells[max(0, dy):height - max(0, -dy), max(0, dx):width - max(0, -dx)]
+        return out
+
+    @staticmethod
+    def neighbors(mask:Cells, diagonal:bool=True) -> Cells:
+        # number of set cells around each cell as one sum of shifted views
+        height, width = mask.shape
+        padded:Cells = np.zeros((height + 2, width + 2), np.uint8)
+        padded[1:-1, 1:-1] = mask
+        counts:Cells = np.zeros((height, width), np.uint8)
+        for dy, dx in (DIRS8 if diagonal else DIRS4):
+            counts += padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+        return counts
+
+### searches
+
+UNREACHED:int = -1
+
+Moves = Union[Sequence[int], Callable[[int], Iterable[int]]]
+
+def shortest_paths(size:int, sources:Iterable[int], moves:Moves,
+                   allowed:Optional[Callable[[int,int],bool]]=None,
+                   weight:Optional[Callable[[int,int],int]]=None, weights:Optional[Iterable[int]]=None,
+                   targets:Iterable[int]=(), heuristic:Optional[Callable[[int],int]]=None) -> Tuple["array[int]", "array[int]"]:
+    # distance and parent of every node in 0..size-1 from the nearest source
+    # (UNREACHED if never reached), stopping early once any target is settled
+    #
+    #   moves      offsets added to a node, or a function listing its neighbours
+    #   allowed    allowed(node, neighbour) keeps an edge, all edges by default
+    #   weight     weight(node, neighbour) for edges that are not all 1, with
+    #   weights    every value it can return, which picks the algorithm:
+    #              bfs for 1, a 0-1 bfs deque for 0 and 1, dijkstra otherwise
+    #              (also when weight is given without its weights), and a*
+    #              when a heuristic and targets are given
+    distance:array[int] = array("q", [UNREACHED]) * size
+    parent:array[int] = array("q", [UNREACHED]) * size
+    if callable(moves):
+        neighbors:Callable[[int], Iterable[int]] = moves
+    else:
+        offsets:Tuple[int,...] = tuple(moves)
+        neighbors = lambda node: [node + offset for offset in offsets]
+    goals = set(targets)
+    starts:List[int] = list(sources)
+    for source in starts:
+        distance[source] = 0
+    # unknown weights are left to dijkstra
+    costs:Optional[set[int]] = {1} if weight is None else None if weights is None else set(weights)
+    astar:bool = heuristic is not None and bool(goals)
+
+    if costs == {1} and not astar:
+        queue:deque[int] = deque(starts)
+        while queue:
+            node:int = queue.popleft()
+            if node in goals:
+                break
+            steps:int = distance[node] + 1
+            for step in neighbors(node):
+                if distance[step] == UNREACHED and (allowed is None or allowed(node, step)):
+                    distance[step] = steps
+                    parent[step] = node
+                    queue.append(step)
+        return distance, parent
+
+    cost = weight or (lambda node, step: 1)
+    settled:bytearray = bytearray(size)
+    if costs is not None and costs <= {0, 1} and not astar:
+        # a zero edge goes to the front, so the deque stays sorted by distance
+        queue = deque(starts)
+        while queue:
+            node = queue.popleft()
+            if settled[node]:
+                continue
+            settled[node] = 1
+            if node in goals:
+                break
+            for step in neighbors(node):
+                if settled[step] or not (allowed is None or allowed(node, step)):
+                    continue
+                w:int = cost(node, step)
+                if distance[step] == UNREACHED or distance[node] + w < distance[step]:
+                    distance[step] = distance[node] + w
+                    parent[step] = node
+                    if w: queue.append(step)
+                    else: queue.appendleft(step)
+        return distance, parent
+
+    estimate = heuristic if astar and heuristic else (lambda node: 0)
+    heap:List[Tuple[int,int]] = [(estimate(source), source) for source in starts]
+    while heap:
+        _, node = heappop(heap)
+        if settled[node]:
+            continue
+        settled[node] = 1
+        if node in goals:
+            break
+        for step in neighbors(node):
+            if settled[step] or not (allowed is None or allowed(node, step)):
+                continue
+            total:int = distance[node] + cost(node, step)
+            if distance[step] == UNREACHED or total < distance[step]:
+                distance[step] = total
+                parent[step] = node
+                heappush(heap, (total + estimate(step), step))
+    return distance, parent
+
+def walk(parent:"array[int]", node:int) -> List[int]:
+    # the path from a source to node along the parents of a search
+    path:List[int] = [node]
+    while parent[node] != UNREACHED:
+        node = parent[node]
+        path.append(node)
+    return path[::-1]
+
+if __name__ == "__main__":
+    print("[ Grid ]:")
+    grid = Grid.parse("#.@\n.@.\n@@#\n")
+    assert (grid.height, grid.width) == (3, 3), "❌ Parse"
+    assert grid.find("@") == (0, 2) and grid.findall("#") == [(0, 0), (2, 2)], "❌ Parse"
+    assert str(grid) == "#.@\n.@.\n@@#\n", "❌ Parse"; print("✅ Parse")
+    grid.cells[1, 1] = ord("#")
+    assert grid.buffer[grid.index(1, 1)] == ord("#"), "❌ Shared Memory"; print("✅ Shared Memory")
+    assert Grid.neighbors(grid.mask("@")).tolist() == [[0,1,0],[2,3,2],[1,1,1]], "❌ Neighbors"
+    assert Grid.neighbors(grid.mask("#."), diagonal=False).tolist() == [[2,2,2],[2,3,2],[1,2,1]], "❌ Neighbors"; print("✅ Neighbors")
+    assert Grid.shift(grid.digits(), 0, 1, 9)[:, 2].tolist() == [9, 9, 9], "❌ Shift"; print("✅ Shift")
+    padded = grid.padded()
+    i = padded.index(1, 1)
+    assert [chr(padded.buffer[i + offset]) for offset in padded.offsets()] == ["#", ".", ".", "#"], "❌ Padded"; print("✅ Padded")
+    maze = Grid.parse("#####\n#..##\n#.#.#\n#...#\n#####\n")
+    open_cell = lambda node, step: maze.buffer[step] != ord("#")
+    distance, parent = shortest_paths(25, [maze.index(1, 1)], maze.offsets(), open_cell)
+    assert distance[maze.index(2, 3)] == 5 and distance[maze.index(1, 3)] == UNREACHED, "❌ BFS"
+    assert walk(parent, maze.index(2, 3)) == [6, 11, 16, 17, 18, 13], "❌ BFS"; print("✅ BFS")
+    start, goal, gate = maze.index(1, 1), maze.index(3, 3), maze.index(3, 1)
+    toll = lambda node, step: 5 if step == gate else 1
+    free = lambda node, step: 0 if step == gate else 1
+    manhattan = lambda node: abs(node // 5 - 3) + abs(node % 5 - 3)
+    assert shortest_paths(25, [start], maze.offsets(), open_cell, toll, (1, 5), [goal])[0][goal] == 8, "❌ Dijkstra"
+    assert shortest_paths(25, [start], maze.offsets(), open_cell, toll)[0][goal] == 8, "❌ Dijkstra"
+    assert shortest_paths(25, [start], maze.offsets(), open_cell, toll, (1, 5), [goal], manhattan)[0][goal] == 8, "❌ A*"
+    assert shortest_paths(25, [start], maze.offsets(), open_cell, free, (0, 1), [goal])[0][goal] == 3, "❌ 0-1 BFS"
+    print("✅ Weighted\n")